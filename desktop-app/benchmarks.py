@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+"""
+Comet Browser Mastery - Benchmarks
+Performance measurements for the desktop application
+
+Run every benchmark, or a single one by name:
+    python3 benchmarks.py
+    python3 benchmarks.py cards
+"""
+
+import asyncio
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tkinter as tk
+import tracemalloc
+
+import comet_browser_mastery_gui as gui
+import render_client
+
+
+def count_widgets(widget):
+    """Count a widget and all of its descendants"""
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+
+def synthetic_use_cases(count):
+    """Repeat the built-in use cases until there are `count` of them"""
+    use_cases = []
+    for idx in range(count):
+        use_case = dict(gui.USE_CASES[idx % len(gui.USE_CASES)])
+        use_case['id'] = f"{use_case['id']}-{idx}"
+        use_cases.append(use_case)
+    return use_cases
+
+
+def bench_cards():
+    """Widget count and main menu build time for both card renderers"""
+    root = tk.Tk()
+    root.withdraw()
+    builtin = gui.USE_CASES
+
+    print(f"{'cards':>6} {'renderer':>9} {'widgets':>8} {'build ms':>9}")
+    try:
+        for count in (6, 100, 1000):
+            gui.USE_CASES = synthetic_use_cases(count)
+            for renderer in ('widgets', 'canvas'):
+                start = time.perf_counter()
+                gui.CometBrowserMasteryApp(root, card_renderer=renderer)
+                root.update_idletasks()
+                elapsed = (time.perf_counter() - start) * 1000
+                print(f"{count:>6} {renderer:>9} {count_widgets(root):>8} {elapsed:>9.1f}")
+    finally:
+        gui.USE_CASES = builtin
+        root.destroy()
+
+
+def bench_resize():
+    """Layout passes and frame time while the main window is resized
+
+    'direct' is the old wiring for comparison: every <Configure> reflows
+    and recomputes bbox("all") on the spot. 'coalesced' is LayoutScheduler.
+    """
+    root = tk.Tk()
+    steps = 200
+
+    def direct_layout(scheduler):
+        # Replace the scheduler's bindings with synchronous layout passes
+        def on_configure(event):
+            scheduler.requests += 1
+            scheduler.passes += 1
+            width = scheduler.canvas.winfo_width()
+            if scheduler.card_grid is not None and width > 1:
+                scheduler.card_grid.reflow(width - scheduler.margin)
+            scheduler.canvas.configure(scrollregion=scheduler.canvas.bbox("all"))
+
+        scheduler.inner_frame.bind('<Configure>', on_configure)
+        scheduler.canvas.bind('<Configure>', on_configure)
+
+    print(f"{'renderer':>9} {'mode':>10} {'events':>7} {'passes':>7} {'ms/step':>8}")
+    try:
+        for renderer in ('widgets', 'canvas'):
+            for mode in ('direct', 'coalesced'):
+                app = gui.CometBrowserMasteryApp(root, card_renderer=renderer)
+                root.geometry("800x800")
+                root.update()
+                scheduler = app.layout_scheduler
+                if mode == 'direct':
+                    direct_layout(scheduler)
+                scheduler.requests = scheduler.passes = 0
+
+                start = time.perf_counter()
+                for step in range(steps):
+                    # Sweep between two and four card columns and back
+                    width = 800 + abs((step % 100) - 50) * 12
+                    root.geometry(f"{width}x800")
+                    root.update()
+                elapsed = (time.perf_counter() - start) * 1000
+
+                print(f"{renderer:>9} {mode:>10} {scheduler.requests:>7} {scheduler.passes:>7} "
+                      f"{elapsed / steps:>8.2f}")
+    finally:
+        root.destroy()
+
+
+def time_call(func, *args):
+    """Wall time of one call in milliseconds"""
+    start = time.perf_counter()
+    func(*args)
+    return (time.perf_counter() - start) * 1000
+
+
+def bench_template():
+    """Parse + render time of adversarial templates at doubling sizes
+
+    Linear behaviour shows up as the time roughly doubling along each row.
+    """
+    data = {'a': 'yes', 'b': 'value', 'empty': ''}
+    cases = {
+        'blocks': lambda n: '{{#if a}}x {{b}} {{else}}y{{/if}}' * n,
+        'unclosed if': lambda n: '{{#if a}} text ' * n,
+        'stray close': lambda n: 'text {{/if}}{{else}}' * n,
+        'open braces': lambda n: '{{' * n,
+        'deep nesting': lambda n: '{{#if a}}' * n + '{{b}}' + '{{/if}}' * n,
+        'empty blocks': lambda n: '{{#if empty}}' + 'x{{b}}' * n + '{{/if}}',
+    }
+    sizes = (1000, 2000, 4000, 8000, 16000)
+
+    print(f"{'case':>14} " + ' '.join(f"{n:>8}" for n in sizes) + '   (ms)')
+    for name, make in cases.items():
+        times = [time_call(lambda t: gui.CompiledTemplate(t).render(data), make(n)) for n in sizes]
+        print(f"{name:>14} " + ' '.join(f"{t:>8.2f}" for t in times))
+
+    # Megabyte-sized values are copied into the output once
+    template = gui.CompiledTemplate('Context: {{b}}\n' * 10)
+    for megabytes in (1, 2, 4, 8):
+        value = 'x' * (megabytes * 1024 * 1024)
+        elapsed = time_call(template.render, {'b': value})
+        print(f"{'value ' + str(megabytes) + ' MB':>14} {elapsed:>8.2f}")
+
+
+def bench_search():
+    """Search index build time and per-keystroke query time"""
+    for count in (100, 1000, 5000):
+        cards = synthetic_use_cases(count)
+        build = time_call(gui.SearchIndex, cards)
+        index = gui.SearchIndex(cards)
+
+        # Type each query one character at a time
+        keystrokes = []
+        for query in ('objection handling', 'expired listing price', 'comet'):
+            for end in range(1, len(query) + 1):
+                keystrokes.append(time_call(index.search, query[:end]))
+        keystrokes.sort()
+        median = keystrokes[len(keystrokes) // 2]
+        print(f"{count:>6} cards  build {build:>8.1f} ms  "
+              f"keystroke median {median:.2f} ms  max {keystrokes[-1]:.2f} ms")
+
+
+def bench_select():
+    """Option index build time and prefix lookup time for large select lists"""
+    for count in (10000, 100000, 1000000):
+        options = [f"{idx:07d} Market" for idx in range(count)]
+        build = time_call(gui.OptionIndex, options)
+        index = gui.OptionIndex(options)
+
+        lookups = [time_call(index.prefix, prefix) for prefix in ('', '0', '00012', '0999', 'zzz')]
+        print(f"{count:>8} options  build {build:>8.1f} ms  "
+              f"worst prefix lookup {max(lookups):.3f} ms")
+
+
+def bench_batch():
+    """Numeric column normalization and batch rendering throughput on 1M rows"""
+    rows = 1000000
+    chunk = gui.BATCH_CHUNK_SIZE
+    samples = ['$750,000', '750K', '$1.2M', '180 days', '2,500 sq ft', 'call for price', '']
+    columns = {
+        'mixed samples': [samples[idx % len(samples)] for idx in range(rows)],
+        'list prices': [f"${(idx * 7919 % 4900 + 100) * 1000:,}" for idx in range(rows)],
+        'all distinct': [f"${idx * 7:,}" for idx in range(rows)],
+    }
+
+    print(f"{'column':>14} {'per row ms':>11} {'column ms':>10} {'rows/s':>12}")
+    for name, column in columns.items():
+        per_row = column_time = 0
+        for start in range(0, rows, chunk):
+            values = column[start:start + chunk]
+            per_row += time_call(lambda: [gui.normalize_value('currency', value) for value in values])
+            column_time += time_call(gui.normalize_column, 'currency', values)
+        print(f"{name:>14} {per_row:>11.0f} {column_time:>10.0f} {rows / column_time * 1000:>12,.0f}")
+
+    use_case = gui.find_use_case('expired-fsbo')
+    records = ({
+        'listingType': 'Expired Listing',
+        'address': f"{idx} Ocean Dr",
+        'listPrice': columns['list prices'][idx],
+        'daysOnMarket': samples[(idx + 3) % len(samples)],
+    } for idx in range(rows))
+    start = time.perf_counter()
+    for _ in gui.render_batch(use_case, records):
+        pass
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"{'render_batch':>14} {elapsed:>23.0f} {rows / elapsed * 1000:>12,.0f}")
+
+
+def bench_history():
+    """Memory held by undo history during a long editing session
+
+    Edit values are created before measuring, so the numbers are the
+    snapshot structures only. 'copies' is what storing a full copy of
+    every field's text per step would take.
+    """
+    steps = 10000
+    print(f"{'fields':>6} {'steps':>6} {'persistent KB':>14} {'dict KB':>9} {'copies KB':>10}")
+    for field_count in (6, 50, 200):
+        field_ids = [f"field{idx}" for idx in range(field_count)]
+        values = {field_id: 'x' * 500 for field_id in field_ids}
+
+        # Each step types into one field (every field is edited in turn)
+        edits = []
+        for step in range(steps):
+            field_id = field_ids[(step // 20) % field_count]
+            edits.append((field_id, values[field_id] + str(step)))
+
+        def measure(make_snapshot):
+            tracemalloc.start()
+            before = tracemalloc.get_traced_memory()[0]
+            history = make_snapshot(values, edits)
+            used = tracemalloc.get_traced_memory()[0] - before
+            tracemalloc.stop()
+            del history
+            return used / 1024
+
+        def persistent(values, edits):
+            history = gui.FormHistory(values, limit=steps)
+            for step, (field_id, value) in enumerate(edits):
+                history.record(field_id, value, now=step * 10.0)  # No grouping
+            return history
+
+        def dicts(values, edits):
+            snapshots = [dict(values)]
+            for field_id, value in edits:
+                snapshot = dict(snapshots[-1])
+                snapshot[field_id] = value
+                snapshots.append(snapshot)
+            return snapshots
+
+        copies = steps * sum(len(value) for value in values.values()) / 1024
+        print(f"{field_count:>6} {steps:>6} {measure(persistent):>14,.0f} {measure(dicts):>9,.0f} {copies:>10,.0f}")
+
+
+def bench_daemon():
+    """Per-call latency of render_client.py with and without the render daemon"""
+    here = os.path.dirname(os.path.abspath(__file__))
+    socket_path = os.path.join(tempfile.mkdtemp(), 'render.sock')
+    env = dict(os.environ, COMET_RENDER_SOCKET=socket_path)
+    client = [sys.executable, os.path.join(here, 'render_client.py'),
+              'expired-fsbo', 'listingType=Expired Listing', 'address=123 Main St', 'listPrice=750K']
+    calls = 20
+
+    def run_client():
+        subprocess.run(client, env=env, check=True, stdout=subprocess.DEVNULL)
+
+    def median(times):
+        return sorted(times)[len(times) // 2]
+
+    cold = [time_call(run_client) for _ in range(calls)]
+
+    daemon = subprocess.Popen(
+        [sys.executable, os.path.join(here, 'comet_browser_mastery_gui.py'), '--serve', '--socket', socket_path],
+        stderr=subprocess.DEVNULL
+    )
+    try:
+        while not os.path.exists(socket_path):
+            time.sleep(0.01)
+        warm = [time_call(run_client) for _ in range(calls)]
+        request = {'use_case': 'expired-fsbo', 'fields': {'listingType': 'Expired Listing', 'address': '123 Main St'}}
+        roundtrip = [time_call(render_client.render_via_daemon, request, socket_path) for _ in range(calls)]
+    finally:
+        daemon.terminate()
+        daemon.wait()
+
+    print(f"cold  client, in-process render  median {median(cold):>7.1f} ms")
+    print(f"warm  client, daemon render      median {median(warm):>7.1f} ms")
+    print(f"      socket round trip only     median {median(roundtrip):>7.2f} ms")
+
+
+def bench_export():
+    """Bundle write throughput and the longest UI stall while copying to the clipboard"""
+    entries = [{'title': f"Prompt {idx}", 'time': time.time(), 'prompt': 'x' * 20000 + '\n'}
+               for idx in range(500)]
+    size_mb = sum(len(entry['prompt']) for entry in entries) / 1e6
+    print(f"{'bundle':>10} {'MB':>6} {'ms':>8} {'MB/s':>7}")
+    for fmt in ('markdown', 'html'):
+        with tempfile.TemporaryFile('w', encoding='utf-8') as output:
+            elapsed = time_call(gui.write_bundle, entries, output, fmt)
+        print(f"{fmt:>10} {size_mb:>6.1f} {elapsed:>8.1f} {size_mb / elapsed * 1000:>7.0f}")
+
+    # A single append blocks the event loop for the whole copy; chunked
+    # appends block it for one chunk at a time
+    root = tk.Tk()
+    root.withdraw()
+    try:
+        print()
+        print(f"{'clipboard MB':>12} {'single append ms':>17} {'longest chunk ms':>17}")
+        for size in (1, 4, 16):
+            text = 'x' * (size * 1000000)
+            root.clipboard_clear()
+            single = time_call(root.clipboard_append, text)
+            root.clipboard_clear()
+            longest = max(
+                time_call(root.clipboard_append, text[pos:pos + gui.CLIPBOARD_CHUNK_SIZE])
+                for pos in range(0, len(text), gui.CLIPBOARD_CHUNK_SIZE)
+            )
+            print(f"{size:>12} {single:>17.1f} {longest:>17.2f}")
+    finally:
+        root.destroy()
+
+
+def bench_asyncio():
+    """Tk event latency while hundreds of async tasks send UI updates through the bridge
+
+    A Tk timer asks to run every 5 ms; its lateness is how long a UI event
+    waits behind the bridge's work. Each task sleeps a few milliseconds and
+    then updates a label, as autosave or a file watcher would.
+    """
+    duration = 2.0
+    print(f"{'tasks':>6} {'updates/s':>10} {'p50 ms':>7} {'p99 ms':>7} {'max ms':>7}")
+    for task_count in (0, 100, 500, 1000):
+        root = tk.Tk()
+        root.withdraw()
+        label = tk.Label(root)
+        bridge = gui.AsyncBridge(root)
+        bridge.start()
+        updates = [0]
+        lateness = []
+
+        def update(value):
+            label.configure(text=value)
+            updates[0] += 1
+
+        async def task(idx):
+            while True:
+                await asyncio.sleep(random.uniform(0.001, 0.01))
+                bridge.call_soon_ui(update, idx)
+
+        for idx in range(task_count):
+            bridge.submit(task(idx))
+
+        def tick(expected):
+            now = time.perf_counter()
+            lateness.append((now - expected) * 1000)
+            root.after(5, tick, now + 0.005)
+
+        root.after(5, tick, time.perf_counter() + 0.005)
+        root.after(int(duration * 1000), root.quit)
+        root.mainloop()
+        bridge.stop()
+        root.destroy()
+
+        lateness.sort()
+        p50 = lateness[len(lateness) // 2]
+        p99 = lateness[int(len(lateness) * 0.99)]
+        print(f"{task_count:>6} {updates[0] / duration:>10,.0f} {p50:>7.2f} {p99:>7.2f} {lateness[-1]:>7.2f}")
+
+
+BENCHMARKS = {
+    'cards': bench_cards,
+    'resize': bench_resize,
+    'template': bench_template,
+    'search': bench_search,
+    'select': bench_select,
+    'batch': bench_batch,
+    'history': bench_history,
+    'daemon': bench_daemon,
+    'export': bench_export,
+    'asyncio': bench_asyncio,
+}
+
+
+def main():
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        print(f"== {name} ==")
+        BENCHMARKS[name]()
+        print()
+
+
+if __name__ == "__main__":
+    main()
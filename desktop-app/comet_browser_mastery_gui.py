@@ -7,10 +7,34 @@ Created by Edmund Bogen
 """
 
 import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox
+from tkinter import ttk, scrolledtext, messagebox, filedialog
+import tkinter.font as tkfont
+import argparse
+import asyncio
+import bisect
+import collections
+import concurrent.futures
+import csv
+import decimal
+import functools
+import html
+import importlib
+import itertools
+import json
+import os
+import queue
 import re
+import signal
+import socketserver
+import sys
+import threading
+import time
+import tracemalloc
+import warnings
 from typing import Dict, List, Optional
 
+from render_client import default_socket_path, render_via_daemon, socket_is_trusted
+
 # Use Cases Data
 USE_CASES = [
     {
@@ -77,6 +101,7 @@ Please provide:
                 'label': 'Price Point',
                 'type': 'text',
                 'placeholder': 'e.g., $450K',
+                'valueType': 'currency'
             },
             {
                 'id': 'location',
@@ -96,7 +121,8 @@ Please provide:
                 'label': 'Number of Touchpoints',
                 'type': 'number',
                 'placeholder': '5',
-                'required': True
+                'required': True,
+                'valueType': 'integer'
             },
             {
                 'id': 'timeframe',
@@ -147,12 +173,14 @@ Make each touchpoint build on the previous one while adding new value.'''
                 'label': 'Original List Price',
                 'type': 'text',
                 'placeholder': 'e.g., $750,000',
+                'valueType': 'currency'
             },
             {
                 'id': 'daysOnMarket',
                 'label': 'Days on Market',
                 'type': 'text',
                 'placeholder': 'e.g., 180 days',
+                'valueType': 'integer'
             },
             {
                 'id': 'propertyDetails',
@@ -210,6 +238,7 @@ Tone: Empathetic, consultative, confident but not arrogant.'''
                 'label': 'Seller Price Expectation',
                 'type': 'text',
                 'placeholder': 'e.g., $950,000',
+                'valueType': 'currency'
             },
             {
                 'id': 'compRange',
@@ -290,6 +319,7 @@ Format as a professional presentation I can deliver to the seller.'''
                 'label': 'Property Price',
                 'type': 'text',
                 'placeholder': 'e.g., $650,000',
+                'valueType': 'currency'
             },
             {
                 'id': 'market',
@@ -387,31 +417,1861 @@ Please provide a detailed, actionable response that I can use immediately in my
 ]
 
 
+# Theme
+#
+# Colors and fonts are shared tokens rather than literals at each widget.
+# Fonts are named tkinter.font.Font objects, so changing the UI scale
+# reconfigures them once and every widget using them follows.
+THEMES = {
+    # Edmund Bogen Brand Color Scheme
+    'brand': {
+        'primary': '#1a3e5c',       # Navy - PRIMARY brand color (60%)
+        'secondary': '#00a8e1',     # Bright Blue - ACCENT color (10-15%)
+        'accent': '#00a8e1',        # Same as secondary for consistency
+        'bg_light': '#f4f4f4',      # Light gray background
+        'bg_white': '#ffffff',      # White (25-30%)
+        'text_dark': '#000000',     # Black for text
+        'text_light': '#333333',    # Dark gray for body text
+        'success': '#00a8e1',       # Bright blue for CTAs
+        'border': '#e8e8e8',        # Light gray border
+        'accent_hover': '#0090c5',  # Darker blue for hovered CTAs
+        'tip_bg': '#e8f4f8',        # Pale blue tip boxes
+        'card_hover': '#faf5ff',    # Pressed card button
+        'text_muted': '#e8e8e8',    # Secondary text on navy
+        'error': '#c0392b'          # Invalid field input
+    },
+    'high-contrast': {
+        'primary': '#000000',
+        'secondary': '#0050a0',
+        'accent': '#0050a0',
+        'bg_light': '#ffffff',
+        'bg_white': '#ffffff',
+        'text_dark': '#000000',
+        'text_light': '#000000',
+        'success': '#0050a0',
+        'border': '#000000',
+        'accent_hover': '#003870',
+        'tip_bg': '#ffffcc',
+        'card_hover': '#e0e0e0',
+        'text_muted': '#ffffff',
+        'error': '#b00000'
+    }
+}
+
+# Font name -> (family, size at 100% scale, weight)
+FONT_SPECS = {
+    'small': ('Helvetica', 10, 'normal'),
+    'body': ('Helvetica', 11, 'normal'),
+    'body_bold': ('Helvetica', 11, 'bold'),
+    'text': ('Helvetica', 12, 'normal'),
+    'text_bold': ('Helvetica', 12, 'bold'),
+    'subtitle': ('Helvetica', 13, 'normal'),
+    'card_title': ('Helvetica', 13, 'bold'),
+    'lead': ('Helvetica', 14, 'normal'),
+    'heading': ('Helvetica', 18, 'bold'),
+    'section': ('Helvetica', 22, 'bold'),
+    'page_title': ('Helvetica', 24, 'bold'),
+    'display': ('Helvetica', 32, 'bold'),
+    'icon': ('Helvetica', 40, 'normal'),
+    'icon_large': ('Helvetica', 50, 'normal'),
+    'mono': ('Courier', 11, 'normal'),
+}
+UI_SCALES = (0.8, 0.9, 1.0, 1.1, 1.25, 1.5, 1.75, 2.0)
+
+
+# Template Rendering
+#
+# The template language has these tags:
+#     {{field}}                          value of a form field
+#     {{#if field}} ... {{/if}}          block shown when the field is filled in
+#     {{#if field}} ... {{else}} ... {{/if}}
+#     {{> fragment}}                     shared fragment from FRAGMENTS
+#     {{#extends fragment}}              (first tag only) render that fragment,
+#     {{#block name}} ... {{/block}}     replacing its blocks with these
+# Blocks nest. Tags that don't form a valid block (an unclosed {{#if}}, a
+# stray {{/if}} or {{else}}), unknown fields and unknown fragments are left
+# in the output as written. Parsing and rendering are single passes, so both
+# are linear in the size of the template plus the size of the values.
+TAG_OPEN = '{{'
+TAG_CLOSE = '}}'
+IF_TAG = re.compile(r'#if\s+(\w+)')
+BLOCK_TAG = re.compile(r'#block\s+(\w+)')
+EXTENDS_TAG = re.compile(r'#extends\s+([\w-]+)')
+INCLUDE_TAG = re.compile(r'>\s*([\w-]+)')
+VAR_TAG = re.compile(r'\w+')
+
+TEXT, VAR, IF, ELSE, ENDIF, BLOCK, ENDBLOCK, INCLUDE, EXTENDS = range(9)
+
+
+def tokenize_template(text):
+    """Split a template into (kind, value, raw) tokens"""
+    tokens = []
+    pos = 0
+    length = len(text)
+    while pos < length:
+        start = text.find(TAG_OPEN, pos)
+        if start == -1:
+            break
+        end = text.find(TAG_CLOSE, start + 2)
+        if end == -1:
+            break  # No tag can close after this point
+
+        # With several openers before one closer only the last can be a tag
+        start = text.rfind(TAG_OPEN, start, end)
+        if start > pos:
+            tokens.append((TEXT, text[pos:start], None))
+
+        raw = text[start:end + 2]
+        body = text[start + 2:end]
+        if body == 'else':
+            tokens.append((ELSE, None, raw))
+        elif body == '/if':
+            tokens.append((ENDIF, None, raw))
+        elif body == '/block':
+            tokens.append((ENDBLOCK, None, raw))
+        elif VAR_TAG.fullmatch(body):
+            tokens.append((VAR, body, raw))
+        else:
+            for kind, pattern in ((IF, IF_TAG), (BLOCK, BLOCK_TAG), (INCLUDE, INCLUDE_TAG), (EXTENDS, EXTENDS_TAG)):
+                match = pattern.fullmatch(body)
+                if match:
+                    tokens.append((kind, match.group(1), raw))
+                    break
+            else:
+                tokens.append((TEXT, raw, None))
+        pos = end + 2
+
+    if pos < length:
+        tokens.append((TEXT, text[pos:], None))
+    return tokens
+
+
+def parse_template(text):
+    """Parse a template into a tree of nodes
+
+    Nodes are interned strings, (VAR, field, raw), (IF, field, then_nodes,
+    else_nodes), (BLOCK, name, nodes) and (INCLUDE, name, raw, cell) tuples,
+    where cell is a one-item list the compiler fills with the fragment's
+    plan. Returns (nodes, include nodes, extended fragment name or None).
+    """
+    tokens = tokenize_template(text)
+
+    # First pass: pair up block tags with a stack so the tree builder knows
+    # which of them are structural and which are literal text
+    structural = [False] * len(tokens)
+    open_blocks = []  # [kind, opening token index, else token index or None]
+    for idx, (kind, _, _) in enumerate(tokens):
+        if kind == IF or kind == BLOCK:
+            open_blocks.append([kind, idx, None])
+        elif kind == ELSE:
+            if open_blocks and open_blocks[-1][0] == IF and open_blocks[-1][2] is None:
+                open_blocks[-1][2] = idx
+        elif kind == ENDIF or kind == ENDBLOCK:
+            if open_blocks and open_blocks[-1][0] == (IF if kind == ENDIF else BLOCK):
+                _, open_idx, else_idx = open_blocks.pop()
+                structural[open_idx] = structural[idx] = True
+                if else_idx is not None:
+                    structural[else_idx] = True
+
+    # {{#extends}} only counts as the first tag of the template
+    extends = None
+    for idx, (kind, value, _) in enumerate(tokens):
+        if kind == EXTENDS:
+            extends = value
+            structural[idx] = True
+        if kind != TEXT or value.strip():
+            break
+
+    # Second pass: build the tree
+    root = []
+    current = root
+    stack = []  # Enclosing (node list, block node) pairs
+    includes = []
+    for idx, (kind, value, raw) in enumerate(tokens):
+        if kind == TEXT:
+            current.append(sys.intern(value))
+        elif kind == VAR:
+            current.append((VAR, value, raw))
+        elif kind == INCLUDE:
+            node = (INCLUDE, value, raw, [None])
+            includes.append(node)
+            current.append(node)
+        elif not structural[idx]:
+            current.append(raw)
+        elif kind == EXTENDS:
+            continue
+        elif kind == IF or kind == BLOCK:
+            block = (IF, value, [], []) if kind == IF else (BLOCK, value, [])
+            current.append(block)
+            stack.append((current, block))
+            current = block[2]
+        elif kind == ELSE:
+            current = stack[-1][1][3]
+        else:  # ENDIF or ENDBLOCK
+            current = stack.pop()[0]
+    return root, includes, extends
+
+
+class CompiledTemplate:
+    """A parsed template that can be rendered many times
+
+    Fragments are linked in when the template is compiled: include nodes
+    point at the fragment's own shared plan, and a template that extends a
+    fragment renders that fragment's nodes with its blocks swapped in.
+    `dependencies` names every fragment the plan was linked against.
+    """
+
+    def __init__(self, text, _active=()):
+        self.text = text
+        nodes, includes, extends = parse_template(text)
+        self.nodes = nodes
+        self.blocks = {}  # Block overrides applied while rendering self.nodes
+        self.dependencies = set()
+        # Fragments left unexpanded because they were still being compiled
+        # further up (a cycle); see compile_fragment
+        self.cycles = set()
+
+        for node in includes:
+            node[3][0] = self._link(node[1], _active)
+
+        if extends is not None:
+            base = self._link(extends, _active)
+            if base is None:
+                self.nodes.insert(0, f'{{{{#extends {extends}}}}}')
+            else:
+                # Only the blocks of a child template count, most derived first
+                self.blocks = dict(base.blocks)
+                self.blocks.update(collect_blocks(nodes))
+                self.nodes = base.nodes
+
+    def _link(self, name, active):
+        self.dependencies.add(name)
+        plan = compile_fragment(name, active)
+        if plan is not None:
+            self.cycles |= plan.cycles
+        elif name in active:
+            self.cycles.add(name)
+        return plan
+
+    def render(self, data):
+        """Render the template with a dict of field values"""
+        out = []
+        # Explicit stack of (node iterator, block overrides), so deep nesting
+        # can't hit the recursion limit
+        stack = [(iter(self.nodes), self.blocks)]
+        while stack:
+            nodes, blocks = stack[-1]
+            for node in nodes:
+                if node.__class__ is str:
+                    out.append(node)
+                elif node[0] == VAR:
+                    value = data.get(node[1])
+                    out.append(node[2] if value is None else value)
+                elif node[0] == IF:
+                    stack.append((iter(node[2] if data.get(node[1]) else node[3]), blocks))
+                    break
+                elif node[0] == BLOCK:
+                    stack.append((iter(blocks.get(node[1], node[2])), blocks))
+                    break
+                else:  # INCLUDE
+                    fragment = node[3][0]
+                    if fragment is None:
+                        out.append(node[2])
+                        continue
+                    stack.append((iter(fragment.nodes), fragment.blocks))
+                    break
+            else:
+                stack.pop()
+        return ''.join(out)
+
+
+def collect_blocks(nodes):
+    """Content of every {{#block}} in a node tree, by name"""
+    blocks = {}
+    stack = [nodes]
+    while stack:
+        for node in stack.pop():
+            if node.__class__ is str or node[0] == VAR or node[0] == INCLUDE:
+                continue
+            if node[0] == BLOCK:
+                blocks.setdefault(node[1], node[2])
+                stack.append(node[2])
+            else:  # IF
+                stack.append(node[2])
+                stack.append(node[3])
+    return blocks
+
+
+# Fragments and plan caches
+#
+# Fragments are compiled once and their plans are shared by every template
+# that includes or extends them. Each plan records which fragments it was
+# linked against, so register_fragment only drops the plans that depend on
+# the changed fragment (directly or through other fragments). A fragment
+# plan that had to cut a cycle at some other fragment is only right for the
+# compile that built it, so it is not cached.
+FRAGMENTS = {}  # type: Dict[str, str]
+TEMPLATE_CACHE_SIZE = 256
+
+CacheInfo = collections.namedtuple('CacheInfo', 'hits misses maxsize currsize')
+
+_template_lock = threading.RLock()
+_fragment_owners = {}  # type: Dict[str, Optional[str]]
+_fragment_plans = {}  # type: Dict[str, CompiledTemplate]
+_template_plans = collections.OrderedDict()  # Template text -> plan, least recently used first
+_dependents = collections.defaultdict(set)  # Fragment name -> {('fragment' | 'template', key)}
+_template_cache_stats = {'hits': 0, 'misses': 0}
+
+
+def register_fragment(name, text, owner=None):
+    """Add or replace a fragment, invalidating only the plans that use it
+
+    owner is the id of the pack registering it (None for the app). A
+    fragment can only be replaced by its owner, so two packs can't
+    silently swap each other's fragments.
+    """
+    with _template_lock:
+        if name in FRAGMENTS and _fragment_owners.get(name) != owner:
+            holder = _fragment_owners.get(name)
+            raise ValueError(f"Fragment '{name}' is already registered by "
+                             f"{f'pack {holder!r}' if holder else 'the app'}")
+        FRAGMENTS[name] = text
+        _fragment_owners[name] = owner
+        invalidate_fragment(name)
+
+
+def _forget_plan(kind, key):
+    # Drop a cached plan and its entries in _dependents
+    plans = _fragment_plans if kind == 'fragment' else _template_plans
+    plan = plans.pop(key, None)
+    if plan is None:
+        return
+    for dependency in plan.dependencies:
+        dependents = _dependents.get(dependency)
+        if dependents is not None:
+            dependents.discard((kind, key))
+            if not dependents:
+                del _dependents[dependency]
+
+
+def invalidate_fragment(name):
+    """Drop the cached plans of a fragment and everything built on it"""
+    with _template_lock:
+        pending = [name]
+        seen = set()
+        while pending:
+            fragment = pending.pop()
+            if fragment in seen:
+                continue
+            seen.add(fragment)
+            _forget_plan('fragment', fragment)
+            for kind, key in _dependents.pop(fragment, ()):
+                if kind == 'fragment':
+                    pending.append(key)
+                else:
+                    _forget_plan('template', key)
+
+
+def compile_fragment(name, _active=()):
+    """Shared plan of a fragment, or None if it is unknown or recursive"""
+    with _template_lock:
+        plan = _fragment_plans.get(name)
+        if plan is None:
+            if name not in FRAGMENTS or name in _active:
+                return None
+            plan = CompiledTemplate(FRAGMENTS[name], _active + (name,))
+            plan.cycles.discard(name)
+            if not plan.cycles:
+                _fragment_plans[name] = plan
+                for dependency in plan.dependencies:
+                    _dependents[dependency].add(('fragment', name))
+        return plan
+
+
+def compile_template(text):
+    """Compile a template, reusing the plan for identical text"""
+    with _template_lock:
+        plan = _template_plans.get(text)
+        if plan is not None:
+            _template_cache_stats['hits'] += 1
+            _template_plans.move_to_end(text)
+            return plan
+
+        _template_cache_stats['misses'] += 1
+        plan = CompiledTemplate(text)
+        _template_plans[text] = plan
+        for dependency in plan.dependencies:
+            _dependents[dependency].add(('template', text))
+        if len(_template_plans) > TEMPLATE_CACHE_SIZE:
+            _forget_plan('template', next(iter(_template_plans)))
+        return plan
+
+
+def template_cache_info():
+    """Hit/miss counts of the compiled template cache"""
+    return CacheInfo(_template_cache_stats['hits'], _template_cache_stats['misses'],
+                     TEMPLATE_CACHE_SIZE, len(_template_plans))
+
+
+def render_template(text, data):
+    """Render template text with a dict of field values"""
+    return compile_template(text).render(data)
+
+
+# Numeric Fields
+#
+# Fields can declare a 'valueType' of 'currency', 'integer' or 'area'. In
+# batch runs the values of such fields are parsed ("$750K", "180 days",
+# "2,500 sq ft") and re-formatted consistently ("$750,000", "180",
+# "2,500 sq ft") before rendering. Only the units of the field's own type
+# are recognised, k/m multipliers only apply to prices and areas, commas
+# must sit between thousands, and only currency keeps cents. Values that
+# don't fit are kept as written. Batch columns repeat the same few prices
+# and day counts over and over, so a column is normalized by parsing each
+# distinct value once.
+NUMBER_UNITS = {
+    'currency': ('usd', '$'),
+    'integer': ('days', 'day'),
+    'area': ('square feet', 'sq. ft.', 'sq.ft.', 'sq ft', 'sqft', 'ft²', 'ft2', 'sf'),
+}
+NUMBER_SUFFIXES = {
+    'currency': (('k', 1000), ('m', 1000000)),
+    'area': (('k', 1000), ('m', 1000000)),
+}
+NUMBER_PATTERN = re.compile(r'(\d{1,3}(,\d{3})+|\d+)(\.\d+)?')  # Commas only between thousands
+VALUE_FORMATS = {
+    'currency': '${:,}',
+    'integer': '{:,}',
+    'area': '{:,} sq ft',
+}
+
+
+def clean_number_text(value_type, text):
+    """Lowercase a value and strip the leading/trailing units of its value type"""
+    text = text.strip().lower()
+    for unit in NUMBER_UNITS[value_type]:
+        if text.startswith(unit):
+            text = text[len(unit):].strip()
+        if text.endswith(unit):
+            text = text[:-len(unit)].strip()
+    return text
+
+
+def parse_number(value_type, text):
+    """Numeric value of a free-text field as a Decimal, or None if it doesn't parse"""
+    text = clean_number_text(value_type, text)
+    multiplier = 1
+    for suffix, factor in NUMBER_SUFFIXES.get(value_type, ()):
+        if text.endswith(suffix):
+            text = text[:-1].strip()
+            multiplier = factor
+            break
+    if not NUMBER_PATTERN.fullmatch(text):
+        return None
+    return decimal.Decimal(text.replace(',', '')) * multiplier
+
+
+def format_number(value_type, number):
+    """Format a parsed number for its value type, or None if it doesn't fit
+
+    Whole numbers fit every type; currency also takes cents.
+    """
+    if number == number.to_integral_value():
+        return VALUE_FORMATS[value_type].format(int(number))
+    if value_type == 'currency' and number * 100 == (number * 100).to_integral_value():
+        return f"${number:,.2f}"
+    return None
+
+
+def normalize_value(value_type, text):
+    """Normalize a single field value, keeping it as-is if it doesn't parse"""
+    number = parse_number(value_type, text)
+    if number is None:
+        return text
+    formatted = format_number(value_type, number)
+    return text if formatted is None else formatted
+
+
+def normalize_column(value_type, values):
+    """Normalize a column of field values, parsing each distinct value once"""
+    normalized = {}
+    column = []
+    for value in values:
+        result = normalized.get(value)
+        if result is None:
+            result = normalized[value] = normalize_value(value_type, value)
+        column.append(result)
+    return column
+
+
+# Use Case Packs
+#
+# Team-specific template packs are installed as separate distributions that
+# advertise a lightweight metadata dict under this entry point group, e.g.
+#
+#     [project.entry-points."comet_browser_mastery.packs"]
+#     commercial = "brokerage_packs.meta:COMMERCIAL"
+#
+# where COMMERCIAL = {'id': ..., 'title': ..., 'icon': ..., 'description': ...,
+#                     'use_cases': 'brokerage_packs.commercial:USE_CASES'}
+#
+# Only the metadata module is imported at startup; the 'use_cases' reference
+# is imported the first time the pack's card is opened.
+PACK_ENTRY_POINT_GROUP = 'comet_browser_mastery.packs'
+
+
+class UseCasePack:
+    """A plugin pack whose use cases are imported on first use"""
+
+    def __init__(self, id, title, icon, description, use_cases):
+        self.id = id
+        self.title = title
+        self.icon = icon
+        self.description = description
+        self.use_cases_ref = use_cases  # 'module:attribute' string
+        self._use_cases = None
+
+    @property
+    def loaded(self):
+        return self._use_cases is not None
+
+    def card(self):
+        """Card data for the main menu, without loading the pack"""
+        return {
+            'id': self.id,
+            'title': self.title,
+            'icon': self.icon,
+            'description': self.description,
+            'pack': self
+        }
+
+    def load(self):
+        """Import the pack's module and return its use cases"""
+        if self._use_cases is None:
+            module_name, _, attribute = self.use_cases_ref.partition(':')
+            module = importlib.import_module(module_name)
+            use_cases = getattr(module, attribute or 'USE_CASES')
+            for name, text in getattr(module, 'FRAGMENTS', {}).items():
+                try:
+                    register_fragment(name, text, owner=self.id)
+                except ValueError as exc:
+                    warnings.warn(f"Skipping fragment from pack '{self.id}': {exc}")
+            self._use_cases = list(use_cases)
+        return self._use_cases
+
+
+PACKS = {}  # type: Dict[str, UseCasePack]
+
+
+def register_pack(metadata):
+    """Register a pack from its metadata dict"""
+    pack = UseCasePack(
+        metadata['id'],
+        metadata['title'],
+        metadata.get('icon', '📦'),
+        metadata.get('description', ''),
+        metadata['use_cases']
+    )
+    PACKS[pack.id] = pack
+    return pack
+
+
+def discover_packs():
+    """Register every pack advertised through installed entry points"""
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:  # Python < 3.8
+        return
+
+    eps = entry_points()
+    if hasattr(eps, 'select'):
+        eps = eps.select(group=PACK_ENTRY_POINT_GROUP)
+    else:
+        eps = eps.get(PACK_ENTRY_POINT_GROUP, [])
+
+    for ep in eps:
+        try:
+            register_pack(ep.load())
+        except Exception as exc:
+            warnings.warn(f"Skipping use case pack '{ep.name}': {exc}")
+
+
+# Batch Mode
+#
+# Renders one use case for every row of a CSV file whose columns are field
+# ids, without opening the GUI. Rows are processed in chunks so typed columns
+# can be normalized a chunk at a time and memory stays flat for large files.
+BATCH_CHUNK_SIZE = 10000
+
+
+def find_use_case(use_case_id):
+    """Look up a use case by id in the built-in catalog and installed packs"""
+    for use_case in USE_CASES:
+        if use_case['id'] == use_case_id:
+            return use_case
+    for pack in PACKS.values():
+        for use_case in pack.load():
+            if use_case['id'] == use_case_id:
+                return use_case
+    raise KeyError(f"Unknown use case: {use_case_id}")
+
+
+def batch_field_data(fields, rows):
+    """Field values of a chunk of rows, with typed columns normalized"""
+    columns = {}
+    for field in fields:
+        column = [(row.get(field['id']) or '').strip() for row in rows]
+        if field.get('valueType') in VALUE_FORMATS:
+            column = normalize_column(field['valueType'], column)
+        columns[field['id']] = column
+
+    return [{field_id: column[idx] for field_id, column in columns.items()} for idx in range(len(rows))]
+
+
+def render_batch(use_case, rows, chunk_size=BATCH_CHUNK_SIZE):
+    """Render a use case for each row dict
+
+    Yields {'row': n, 'prompt': ...} or {'row': n, 'error': ...} per row,
+    with rows numbered from 1.
+    """
+    template = compile_template(use_case['promptTemplate'])
+    required = [field for field in use_case['fields'] if field.get('required')]
+    rows = iter(rows)
+    row_number = 0
+
+    for chunk in iter(lambda: list(itertools.islice(rows, chunk_size)), []):
+        for data in batch_field_data(use_case['fields'], chunk):
+            row_number += 1
+            missing = next((field for field in required if not data[field['id']]), None)
+            if missing:
+                yield {'row': row_number, 'error': f"Missing required field: {missing['label']}"}
+            else:
+                yield {'row': row_number, 'prompt': template.render(data).strip()}
+
+
+def run_batch(use_case_id, csv_path, output, chunk_size=BATCH_CHUNK_SIZE):
+    """Render every row of a CSV file and write JSON lines to output"""
+    use_case = find_use_case(use_case_id)
+    with open(csv_path, newline='', encoding='utf-8') as f:
+        for result in render_batch(use_case, csv.DictReader(f), chunk_size):
+            output.write(json.dumps(result) + '\n')
+
+
+# Render Daemon
+#
+# A long-lived process that keeps the catalog and its compiled templates in
+# memory and renders requests arriving on a Unix domain socket, so shell
+# scripts calling render_client.py once per lead skip interpreter startup
+# and module import. One JSON request per line:
+#     {"use_case": "expired-fsbo", "fields": {"address": "..."}}
+# answered by one JSON line with either "prompt" or "error".
+
+
+def handle_render_request(request):
+    """Render one request dict, returning {'prompt': ...} or {'error': ...}"""
+    use_case_id = request.get('use_case')
+    if not isinstance(use_case_id, str) or not use_case_id:
+        return {'error': "Request needs a 'use_case' id"}
+    try:
+        use_case = find_use_case(use_case_id)
+    except KeyError as exc:
+        return {'error': str(exc).strip('"\'')}
+    fields = request.get('fields') or {}
+    result = next(render_batch(use_case, [fields]))
+    del result['row']
+    return result
+
+
+class RenderRequestHandler(socketserver.StreamRequestHandler):
+    """Answers each JSON line on a connection with one JSON line"""
+
+    def handle(self):
+        for line in self.rfile:
+            try:
+                result = handle_render_request(json.loads(line))
+            except (ValueError, TypeError, AttributeError) as exc:
+                result = {'error': f"Bad request: {exc}"}
+            self.wfile.write(json.dumps(result).encode('utf-8') + b'\n')
+            self.wfile.flush()
+
+
+def serve(socket_path=None):
+    """Run the render daemon until interrupted"""
+    if not hasattr(socketserver, 'ThreadingUnixStreamServer'):
+        raise SystemExit("The render daemon needs Unix domain sockets")
+
+    socket_path = socket_path or default_socket_path(create=True)
+    if socket_path is None:
+        raise SystemExit("No private directory for the socket; set XDG_RUNTIME_DIR or use --socket")
+    if os.path.lexists(socket_path):
+        if not socket_is_trusted(socket_path):
+            raise SystemExit(f"{socket_path} exists and isn't a socket of yours that only you can replace")
+        if render_via_daemon({'use_case': ''}, socket_path) is not None:
+            raise SystemExit(f"A render daemon is already listening on {socket_path}")
+        os.unlink(socket_path)  # Left over from a daemon that didn't shut down cleanly
+
+    # Warm the caches before accepting requests
+    discover_packs()
+    for use_case in USE_CASES:
+        compile_template(use_case['promptTemplate'])
+
+    old_umask = os.umask(0o177)  # Socket readable and writable by this user only
+    try:
+        server = socketserver.ThreadingUnixStreamServer(socket_path, RenderRequestHandler)
+    finally:
+        os.umask(old_umask)
+    server.daemon_threads = True
+
+    # Shut down (and remove the socket) on kill as well as Ctrl+C
+    def on_terminate(signum, frame):
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, on_terminate)
+
+    print(f"Render daemon listening on {socket_path}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        os.unlink(socket_path)
+
+
+# Pipelines
+#
+# A pipeline chains use cases, feeding values from earlier steps into later
+# ones. Definitions are JSON:
+#     {
+#       "name": "Listing appointment prep",
+#       "inputs": ["address", "price"],
+#       "steps": [
+#         {"id": "comps", "use_case": "competitive-analysis",
+#          "fields": {"subjectProperty": {"from": "input.address"},
+#                     "propertyType": "Single family",
+#                     "sellerExpectation": {"from": "input.price"}}},
+#         {"id": "letter", "use_case": "expired-fsbo",
+#          "fields": {"address": {"from": "comps.subjectProperty"},
+#                     "listingType": "Expired Listing",
+#                     "listPrice": {"from": "input.price"},
+#                     "whyExpired": {"from": "comps.output"}}}
+#       ]
+#     }
+# A field is either a literal string or {"from": "<source>.<name>"}, where
+# the source is 'input' or an earlier step id and the name is one of that
+# step's fields, or 'output' for its rendered prompt. Steps that don't
+# depend on each other are rendered concurrently. Each reference is resolved
+# once no matter how many steps use it.
+PIPELINE_WORKERS = 4
+
+
+class PipelineError(ValueError):
+    """A pipeline definition that can't be run"""
+
+
+def load_pipeline(path):
+    """Read a pipeline definition from a JSON file"""
+    with open(path, encoding='utf-8') as f:
+        pipeline = json.load(f)
+    validate_pipeline(pipeline)
+    return pipeline
+
+
+def pipeline_sources(step):
+    """Ids of the steps (or 'input') a step reads from"""
+    sources = set()
+    for value in step.get('fields', {}).values():
+        if isinstance(value, dict):
+            sources.add(value['from'].partition('.')[0])
+    return sources
+
+
+def validate_pipeline(pipeline):
+    """Check the definition's shape, step ids, use cases and that references only look backwards"""
+    if not isinstance(pipeline, dict):
+        raise PipelineError("A pipeline definition must be a JSON object")
+    if not isinstance(pipeline.get('name', ''), str):
+        raise PipelineError("'name' must be a string")
+    inputs = pipeline.get('inputs', [])
+    if not isinstance(inputs, list) or not all(isinstance(name, str) for name in inputs):
+        raise PipelineError("'inputs' must be a list of names")
+    steps = pipeline.get('steps')
+    if not isinstance(steps, list) or not steps:
+        raise PipelineError("A pipeline needs a non-empty 'steps' list")
+
+    step_fields = {}  # Earlier step id -> the fields it sets
+    for step in steps:
+        if not isinstance(step, dict):
+            raise PipelineError(f"Each step must be an object, not {step!r}")
+        step_id = step.get('id')
+        if not isinstance(step_id, str) or not step_id or step_id in step_fields or step_id == 'input':
+            raise PipelineError(f"Step ids must be unique and not 'input': {step_id!r}")
+        use_case_id = step.get('use_case')
+        if not isinstance(use_case_id, str):
+            raise PipelineError(f"Step '{step_id}' needs a 'use_case' id")
+        try:
+            find_use_case(use_case_id)
+        except KeyError as exc:
+            raise PipelineError(f"Step '{step_id}': {exc.args[0]}")
+
+        fields = step.get('fields', {})
+        if not isinstance(fields, dict):
+            raise PipelineError(f"Step '{step_id}': 'fields' must be an object")
+        for field_id, value in fields.items():
+            if isinstance(value, dict):
+                reference = value.get('from')
+                if not isinstance(reference, str):
+                    raise PipelineError(f"Step '{step_id}' field '{field_id}': 'from' must be a string")
+                source, _, name = reference.partition('.')
+                if source == 'input':
+                    valid = bool(name)
+                else:
+                    valid = source in step_fields and (name == 'output' or name in step_fields[source])
+                if not valid:
+                    raise PipelineError(
+                        f"Step '{step_id}' field '{field_id}': "
+                        f"{reference!r} is not input.<name>, or <step>.output or <step>.<field> "
+                        f"for an earlier step that sets that field")
+            elif not isinstance(value, str):
+                raise PipelineError(f"Step '{step_id}' field '{field_id}' must be a string or a 'from' reference")
+        step_fields[step_id] = fields
+
+
+def pipeline_inputs(pipeline):
+    """Names of the inputs a pipeline declares or references"""
+    names = list(pipeline.get('inputs', []))
+    for step in pipeline['steps']:
+        for value in step.get('fields', {}).values():
+            if isinstance(value, dict):
+                source, _, name = value['from'].partition('.')
+                if source == 'input' and name not in names:
+                    names.append(name)
+    return names
+
+
+def pipeline_levels(pipeline):
+    """Group steps into levels that only depend on earlier levels"""
+    level_of = {}
+    levels = []
+    for step in pipeline['steps']:
+        level = max((level_of[source] + 1 for source in pipeline_sources(step) if source != 'input'), default=0)
+        level_of[step['id']] = level
+        if level == len(levels):
+            levels.append([])
+        levels[level].append(step)
+    return levels
+
+
+def run_pipeline(pipeline, inputs, max_workers=PIPELINE_WORKERS):
+    """Run every step of a pipeline
+
+    Returns one dict per step, in definition order, with 'id', 'use_case',
+    'ms' and either 'prompt' or 'error'.
+    """
+    results = {}
+    step_fields = {}  # step id -> field values it was rendered with
+    resolved = {}  # reference -> value, shared by every step using it
+
+    def resolve(reference):
+        if reference not in resolved:
+            source, _, name = reference.partition('.')
+            if source == 'input':
+                resolved[reference] = inputs.get(name, '')
+            elif name == 'output':
+                resolved[reference] = results[source].get('prompt', '')
+            else:
+                resolved[reference] = step_fields[source].get(name, '')
+        return resolved[reference]
+
+    def run_step(step, fields):
+        start = time.perf_counter()
+        result = {'id': step['id'], 'use_case': step['use_case']}
+        result.update(handle_render_request({'use_case': step['use_case'], 'fields': fields}))
+        result['ms'] = (time.perf_counter() - start) * 1000
+        return result
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for level in pipeline_levels(pipeline):
+            futures = []
+            for step in level:
+                failed = [source for source in pipeline_sources(step) if 'error' in results.get(source, {})]
+                if failed:
+                    results[step['id']] = {'id': step['id'], 'use_case': step['use_case'],
+                                           'error': f"Skipped: step '{failed[0]}' failed", 'ms': 0.0}
+                    continue
+                fields = {
+                    field_id: resolve(value['from']) if isinstance(value, dict) else value
+                    for field_id, value in step.get('fields', {}).items()
+                }
+                step_fields[step['id']] = fields
+                futures.append(executor.submit(run_step, step, fields))
+            for future in futures:
+                result = future.result()
+                results[result['id']] = result
+
+    return [results[step['id']] for step in pipeline['steps']]
+
+
+def run_pipeline_batch(pipeline, rows, output):
+    """Run a pipeline once per input row and write JSON lines to output"""
+    for row_number, row in enumerate(rows, 1):
+        start = time.perf_counter()
+        for result in run_pipeline(pipeline, row):
+            output.write(json.dumps(dict(row=row_number, **result)) + '\n')
+        total = (time.perf_counter() - start) * 1000
+        output.write(json.dumps({'row': row_number, 'total_ms': total}) + '\n')
+
+
+# Prompt Bundles
+#
+# Every prompt generated in a session is kept in memory so a batch of them
+# can be saved as one Markdown or HTML document. Bundles are written one
+# prompt at a time, so a background thread can report progress as it goes
+# and no second copy of the whole document is built in memory.
+PROMPT_HISTORY_LIMIT = 500
+BUNDLE_FORMATS = {'.md': 'markdown', '.markdown': 'markdown', '.html': 'html', '.htm': 'html'}
+
+
+def bundle_format(path):
+    """'markdown' or 'html', from the file extension (Markdown by default)"""
+    return BUNDLE_FORMATS.get(os.path.splitext(path)[1].lower(), 'markdown')
+
+
+def markdown_fence(text):
+    """A code fence longer than any run of backticks inside text"""
+    longest = max((len(run) for run in re.findall(r'`+', text)), default=0)
+    return '`' * max(3, longest + 1)
+
+
+def write_bundle(entries, output, fmt='markdown', progress=None):
+    """Write prompt history entries to a file object as one document
+
+    Entries are dicts with 'title', 'time' (epoch seconds) and 'prompt'.
+    progress, if given, is called with (done, total) after each entry.
+    """
+    total = len(entries)
+    if fmt == 'html':
+        output.write('<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n'
+                     '<title>Prompt Bundle</title>\n</head>\n<body>\n<h1>Prompt Bundle</h1>\n')
+    else:
+        output.write('# Prompt Bundle\n\n')
+
+    for done, entry in enumerate(entries, 1):
+        stamp = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(entry['time']))
+        if fmt == 'html':
+            output.write(f"<h2>{done}. {html.escape(entry['title'])}</h2>\n<p><em>{stamp}</em></p>\n<pre>")
+            output.write(html.escape(entry['prompt']))
+            output.write('</pre>\n')
+        else:
+            fence = markdown_fence(entry['prompt'])
+            output.write(f"## {done}. {entry['title']}\n\n_{stamp}_\n\n{fence}text\n")
+            output.write(entry['prompt'])
+            output.write(f"\n{fence}\n\n")
+        if progress is not None:
+            progress(done, total)
+
+    if fmt == 'html':
+        output.write('</body>\n</html>\n')
+
+
+# Async Bridge
+#
+# Tk must only be touched from the thread running its mainloop, and asyncio
+# wants a loop of its own. The bridge runs an asyncio loop on a background
+# thread for I/O work (autosave, file watching, a local API) and lets those
+# tasks hand UI updates back through a thread-safe queue that the Tk loop
+# drains every ASYNC_POLL_MS. UI updates therefore wait at most about one
+# poll interval, however many async tasks are running.
+ASYNC_POLL_MS = 10
+ASYNC_DRAIN_BUDGET = 0.008  # Seconds of queued UI callbacks run per poll
+ASYNC_QUERY_TIMEOUT = 0.05  # Longest the Tk thread waits on the asyncio loop
+ASYNC_STOP_TIMEOUT = 2.0
+
+
+class AsyncBridge:
+    """Run an asyncio loop alongside the Tk mainloop"""
+
+    def __init__(self, root, poll_ms=ASYNC_POLL_MS):
+        self.root = root
+        self.poll_ms = poll_ms
+        self.loop = asyncio.new_event_loop()
+        self.ui_queue = queue.SimpleQueue()  # (callback, args)
+        self.thread = threading.Thread(target=self._run_loop, name='asyncio-bridge', daemon=True)
+        self.poll_job = None
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def start(self):
+        """Start the asyncio thread and the Tk-side queue polling"""
+        if not self.thread.is_alive():
+            self.thread.start()
+        if self.poll_job is None:
+            self.poll_job = self.root.after(self.poll_ms, self._drain)
+
+    def submit(self, coro):
+        """Schedule a coroutine on the asyncio loop from any thread
+
+        Returns a concurrent.futures.Future for its result.
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def call_soon_ui(self, callback, *args):
+        """Run callback(*args) on the Tk thread; safe to call from any thread"""
+        self.ui_queue.put((callback, args))
+
+    async def run_in_ui(self, callback, *args):
+        """Run callback(*args) on the Tk thread and await its result"""
+        future = self.loop.create_future()
+
+        def settle(setter, value):
+            # The awaiting task may have been cancelled in the meantime
+            if not future.done():
+                setter(value)
+
+        def call():
+            try:
+                result = callback(*args)
+            except BaseException as exc:
+                self.loop.call_soon_threadsafe(settle, future.set_exception, exc)
+            else:
+                self.loop.call_soon_threadsafe(settle, future.set_result, result)
+
+        self.call_soon_ui(call)
+        return await future
+
+    def _drain(self):
+        # Callbacks that arrive while draining wait for the next poll once the
+        # budget is spent, so a flood of updates can't starve Tk's own events
+        deadline = time.perf_counter() + ASYNC_DRAIN_BUDGET
+        while time.perf_counter() < deadline:
+            try:
+                callback, args = self.ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback(*args)
+            except Exception:
+                self.root.report_callback_exception(*sys.exc_info())
+        self.poll_job = self.root.after(self.poll_ms, self._drain)
+
+    def pending_tasks(self):
+        """Number of unfinished tasks on the asyncio loop
+
+        Returns None if the loop doesn't answer within ASYNC_QUERY_TIMEOUT,
+        i.e. something is blocking it, rather than stalling the caller.
+        """
+        if not self.loop.is_running():
+            return 0
+        future = self.submit(self._count_tasks())
+        try:
+            return future.result(timeout=ASYNC_QUERY_TIMEOUT)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            return None
+
+    async def _count_tasks(self):
+        return sum(1 for task in asyncio.all_tasks() if task is not asyncio.current_task())
+
+    def stop(self):
+        """Cancel outstanding tasks and shut the asyncio loop down"""
+        if self.poll_job is not None:
+            try:
+                self.root.after_cancel(self.poll_job)
+            except tk.TclError:
+                pass  # Root already destroyed
+            self.poll_job = None
+        if self.thread.is_alive():
+            # A task blocking the loop must not hang app exit: give up after
+            # ASYNC_STOP_TIMEOUT and leave the daemon thread to die with the process
+            try:
+                self.submit(self._shutdown()).result(timeout=ASYNC_STOP_TIMEOUT)
+            except concurrent.futures.TimeoutError:
+                pass
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join(timeout=ASYNC_STOP_TIMEOUT)
+            if self.thread.is_alive():
+                return
+        self.loop.close()
+
+    async def _shutdown(self):
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self.loop.shutdown_asyncgens()
+
+    def run(self):
+        """Run the Tk mainloop with the asyncio loop beside it until the window closes"""
+        self.start()
+        try:
+            self.root.mainloop()
+        finally:
+            self.stop()
+
+
+# Search
+#
+# Main menu search goes through a trigram index built once per catalog.
+# Text is lowercased, reduced to words and padded with spaces, so
+# 'Lead Follow-Up' yields trigrams ' le', 'lea', 'ead', 'ad ', ' fo', ...
+# A query word matches a card when enough of its trigrams occur in that card.
+# Each word also contributes its first letter as ' x', which lets one-letter
+# queries match.
+SEARCH_WEIGHTS = (
+    ('title', 8),
+    ('description', 4),
+    ('labels', 2),
+    ('template', 1),
+)
+SEARCH_MIN_OVERLAP = 0.7  # Fraction of a query word's trigrams a card must contain
+NON_WORD = re.compile(r'[^0-9a-z]+')
+
+
+def search_words(text):
+    """Lowercased alphanumeric words of a text"""
+    return NON_WORD.sub(' ', text.lower()).split()
+
+
+@functools.lru_cache(maxsize=65536)
+def word_grams(word):
+    """Trigrams of a space-padded word, plus its one-letter prefix"""
+    padded = f' {word} '
+    grams = {padded[i:i + 3] for i in range(len(padded) - 2)}
+    grams.add(padded[:2])
+    return frozenset(grams)
+
+
+def query_grams(word):
+    """Trigrams of a word the user may still be typing (no trailing pad)"""
+    padded = f' {word}'
+    if len(padded) < 3:
+        return {padded}
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SearchIndex:
+    """Inverted trigram index over use case cards"""
+
+    def __init__(self, cards):
+        self.cards = list(cards)
+        self.postings = {}  # trigram -> {card index: weight}
+
+        for idx, card in enumerate(self.cards):
+            texts = {
+                'title': card.get('title', ''),
+                'description': card.get('description', ''),
+                'labels': ' '.join(field['label'] for field in card.get('fields', [])),
+                'template': card.get('promptTemplate', ''),
+            }
+            # Weight of the most important section each trigram appears in
+            card_grams = {}
+            for section, weight in reversed(SEARCH_WEIGHTS):
+                for word in set(search_words(texts[section])):
+                    for gram in word_grams(word):
+                        card_grams[gram] = weight
+
+            postings = self.postings
+            for gram, weight in card_grams.items():
+                posting = postings.get(gram)
+                if posting is None:
+                    posting = postings[gram] = {}
+                posting[idx] = weight
+
+    def search(self, query):
+        """Card indices matching every word of the query, best first"""
+        words = search_words(query)
+        if not words:
+            return list(range(len(self.cards)))
+
+        scores = None
+        for word in words:
+            grams = query_grams(word)
+            needed = max(1, int(len(grams) * SEARCH_MIN_OVERLAP + 0.5))
+            hits = {}
+            counts = {}
+            for gram in grams:
+                for idx, weight in self.postings.get(gram, {}).items():
+                    hits[idx] = hits.get(idx, 0) + weight
+                    counts[idx] = counts.get(idx, 0) + 1
+            word_scores = {idx: score for idx, score in hits.items() if counts[idx] >= needed}
+
+            # Every word has to match
+            if scores is None:
+                scores = word_scores
+            else:
+                scores = {idx: scores[idx] + score for idx, score in word_scores.items() if idx in scores}
+            if not scores:
+                return []
+
+        return sorted(scores, key=lambda idx: (-scores[idx], idx))
+
+
+# Select Options
+#
+# Select fields with long option lists (markets, ZIP codes) are typed into
+# rather than scrolled. Options are kept in a sorted, lowercased list and
+# the matches for a prefix are found with bisect, so the dropdown only ever
+# holds the top SELECT_MATCH_LIMIT entries. A field can name a file with one
+# option per line in 'optionsFile' instead of listing 'options' inline. The
+# file is read the first time the field is used.
+TYPEAHEAD_MIN_OPTIONS = 100  # Inline lists at least this long get type-ahead
+SELECT_MATCH_LIMIT = 50
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class OptionIndex:
+    """Sorted option list with case-insensitive prefix lookup"""
+
+    def __init__(self, options):
+        pairs = sorted((option.lower(), option) for option in options)
+        self.keys = [key for key, _ in pairs]
+        self.options = [option for _, option in pairs]
+
+    def __len__(self):
+        return len(self.options)
+
+    def prefix(self, text, limit=SELECT_MATCH_LIMIT):
+        """Up to `limit` options starting with text, in sorted order"""
+        key = text.lower()
+        start = bisect.bisect_left(self.keys, key)
+        matches = []
+        for idx in range(start, min(start + limit, len(self.keys))):
+            if not self.keys[idx].startswith(key):
+                break
+            matches.append(self.options[idx])
+        return matches
+
+    def __contains__(self, option):
+        idx = bisect.bisect_left(self.keys, option.lower())
+        while idx < len(self.keys) and self.keys[idx] == option.lower():
+            if self.options[idx] == option:
+                return True
+            idx += 1
+        return False
+
+    def lookup(self, text):
+        """The option text names, ignoring case and surrounding space, or None
+
+        An exact match wins over options differing only in case.
+        """
+        text = text.strip()
+        key = text.lower()
+        idx = bisect.bisect_left(self.keys, key)
+        found = None
+        while idx < len(self.keys) and self.keys[idx] == key:
+            if self.options[idx] == text:
+                return text
+            if found is None:
+                found = self.options[idx]
+            idx += 1
+        return found
+
+
+def is_typeahead_field(field):
+    """Whether a select field gets the type-ahead combobox"""
+    return field['type'] == 'select' and (
+        'optionsFile' in field or len(field.get('options', [])) >= TYPEAHEAD_MIN_OPTIONS)
+
+
+_option_file_indexes = {}  # type: Dict[str, OptionIndex]
+
+
+def load_option_index(path):
+    """Index of the options in a file, read once per path"""
+    path = os.path.join(APP_DIR, path)
+    index = _option_file_indexes.get(path)
+    if index is None:
+        with open(path, encoding='utf-8') as f:
+            index = OptionIndex(line.strip() for line in f if line.strip())
+        _option_file_indexes[path] = index
+    return index
+
+
+class CardGrid:
+    """Base class for the use case card grid on the main menu"""
+
+    CARD_WIDTH = 290
+    CARD_HEIGHT = 300
+    GAP = 30
+
+    def __init__(self, app, use_cases, columns=3):
+        self.app = app
+        self.use_cases = list(use_cases)
+        self.columns = columns
+        self.visible = list(range(len(self.use_cases)))  # Card indices in display order
+        self.card_width = self.CARD_WIDTH  # Current card size, see rescale
+        self.card_height = self.CARD_HEIGHT
+
+    def layout(self, columns=None):
+        """Arrange the visible cards in a grid of the given number of columns"""
+        raise NotImplementedError
+
+    def set_card_shown(self, idx, shown):
+        """Show or hide a single card without touching the others"""
+        raise NotImplementedError
+
+    def rescale(self):
+        """Fit the cards to the app's current UI scale"""
+        self.layout()
+
+    def filter(self, indices=None):
+        """Show only the cards at these indices, in this order (None shows all)"""
+        indices = list(range(len(self.use_cases)) if indices is None else indices)
+        wanted = set(indices)
+        current = set(self.visible)
+        for idx in current - wanted:
+            self.set_card_shown(idx, False)
+        for idx in wanted - current:
+            self.set_card_shown(idx, True)
+        self.visible = indices
+        self.layout()
+
+    def reflow(self, available_width):
+        """Pick the column count that fits the available width"""
+        columns = max(1, available_width // (self.card_width + self.GAP))
+        if columns != self.columns:
+            self.layout(columns)
+
+
+class WidgetCardGrid(CardGrid):
+    """Use case cards built as a Frame of Labels each, placed with grid"""
+
+    CARD_WIDTH = 300
+
+    def __init__(self, app, parent, use_cases, columns=3):
+        super().__init__(app, use_cases, columns)
+        self.frame = tk.Frame(parent, bg=app.colors['bg_light'])
+        self.widget = self.frame
+        self.cards = [app.create_use_case_card(self.frame, use_case) for use_case in self.use_cases]
+        self.layout()
+
+    def layout(self, columns=None):
+        """Grid the card frames into the given number of columns"""
+        if columns:
+            self.columns = columns
+
+        for position, idx in enumerate(self.visible):
+            row = position // self.columns
+            col = position % self.columns
+            self.cards[idx].grid(row=row, column=col, padx=15, pady=15, sticky='nsew')
+
+        # Configure grid weights
+        for i in range(max(self.columns, self.frame.grid_size()[0])):
+            self.frame.columnconfigure(i, weight=1 if i < self.columns else 0)
+
+    def set_card_shown(self, idx, shown):
+        if not shown:
+            self.cards[idx].grid_remove()
+
+
+class CanvasCardGrid(CardGrid):
+    """Use case cards drawn as items on a single canvas
+
+    Each card is a handful of canvas items (border, icon, title, description
+    and button) sharing a 'card<N>' tag, so hover and click handlers are bound
+    once per card on the canvas instead of on five separate widgets.
+    """
+
+    def __init__(self, app, parent, use_cases, columns=3):
+        super().__init__(app, use_cases, columns)
+        self.canvas = tk.Canvas(parent, bg=app.colors['bg_light'], highlightthickness=0)
+        self.widget = self.canvas
+
+        # Top-left corner of every card, keyed by card tag
+        self.positions = {}
+        self.tags = [f'card{idx}' for idx in range(len(self.use_cases))]
+        for tag, use_case in zip(self.tags, self.use_cases):
+            self.bind_card(tag, use_case)
+        self.rescale()
+
+    def rescale(self):
+        """Redraw every card for the current UI scale
+
+        Item offsets scale with the UI, and each block of text starts below
+        the one above it as measured with the current fonts. All cards get
+        the height of the tallest one so the grid rows stay even.
+        """
+        self.canvas.delete('all')
+        scale = self.app.ui_scale
+        self.card_width = round(self.CARD_WIDTH * scale)
+
+        bottoms = [self.draw_card(tag, use_case) for tag, use_case in zip(self.tags, self.use_cases)]
+        self.card_height = max([round(self.CARD_HEIGHT * scale)] + [round(bottom + 75 * scale) for bottom in bottoms])
+        for tag, use_case in zip(self.tags, self.use_cases):
+            self.draw_card_frame(tag, use_case)
+
+        shown = set(self.visible)
+        for idx, tag in enumerate(self.tags):
+            self.positions[tag] = (0, 0)
+            if idx not in shown:
+                self.set_card_shown(idx, False)
+        self.layout()
+
+    def draw_card(self, tag, use_case):
+        """Draw a card's icon, title and description at the canvas origin
+
+        Returns the bottom edge of the description.
+        """
+        canvas = self.canvas
+        colors = self.app.colors
+        scale = self.app.ui_scale
+        center = self.card_width // 2
+        text_width = self.card_width - round(40 * scale)
+
+        icon = canvas.create_text(
+            center, round(20 * scale),
+            text=use_case['icon'],
+            font=self.app.fonts['icon'],
+            anchor='n',
+            tags=(tag,)
+        )
+        title = canvas.create_text(
+            center, canvas.bbox(icon)[3] + round(15 * scale),
+            text=use_case['title'].upper(),  # ALL CAPS per brand guidelines
+            font=self.app.fonts['card_title'],
+            fill=colors['primary'],  # Navy
+            width=text_width,
+            justify='center',
+            anchor='n',
+            tags=(tag,)
+        )
+        # Description flows under the (possibly wrapped) title
+        description = canvas.create_text(
+            center, canvas.bbox(title)[3] + round(10 * scale),
+            text=use_case['description'],
+            font=self.app.fonts['small'],
+            fill=colors['text_light'],
+            width=text_width,
+            justify='center',
+            anchor='n',
+            tags=(tag,)
+        )
+        return canvas.bbox(description)[3]
+
+    def draw_card_frame(self, tag, use_case):
+        """Draw a card's border and the button pinned to its bottom"""
+        canvas = self.canvas
+        colors = self.app.colors
+        scale = self.app.ui_scale
+        width, height = self.card_width, self.card_height
+        margin = round(20 * scale)
+
+        border = canvas.create_rectangle(
+            0, 0, width, height,
+            fill=colors['bg_white'],
+            outline=colors['border'],
+            width=2,
+            tags=(tag, f'{tag}-border')
+        )
+        canvas.tag_lower(border, tag)  # Behind the card's text
+        canvas.create_rectangle(
+            margin, height - round(65 * scale), width - margin, height - margin,
+            fill=colors['secondary'],  # Bright blue
+            outline='',
+            tags=(tag, f'{tag}-button', f'{tag}-button-bg')
+        )
+        canvas.create_text(
+            width // 2, height - round(42 * scale),
+            text="BROWSE TEMPLATES →" if 'pack' in use_case else "GENERATE PROMPT →",  # ALL CAPS for CTAs
+            font=self.app.fonts['body_bold'],
+            fill='white',
+            tags=(tag, f'{tag}-button')
+        )
+
+    def bind_card(self, tag, use_case):
+        """Bind hover and click handlers to a card's tag (once; they outlive redraws)"""
+        canvas = self.canvas
+        colors = self.app.colors
+
+        # Hover effects - Bright blue accent
+        def on_enter(e):
+            canvas.itemconfigure(f'{tag}-border', outline=colors['secondary'])  # Bright blue
+            canvas.itemconfigure(f'{tag}-button-bg', fill=colors['accent_hover'])  # Darker blue on hover
+
+        def on_leave(e):
+            canvas.itemconfigure(f'{tag}-border', outline=colors['border'])
+            canvas.itemconfigure(f'{tag}-button-bg', fill=colors['secondary'])  # Back to bright blue
+
+        canvas.tag_bind(tag, '<Enter>', on_enter)
+        canvas.tag_bind(tag, '<Leave>', on_leave)
+        canvas.tag_bind(f'{tag}-button', '<Enter>', lambda e: canvas.configure(cursor='hand2'))
+        canvas.tag_bind(f'{tag}-button', '<Leave>', lambda e: canvas.configure(cursor=''))
+        canvas.tag_bind(f'{tag}-button', '<Button-1>',
+                        lambda e, uc=use_case: self.app.open_card(uc))
+
+    def layout(self, columns=None):
+        """Move cards into a grid of the given number of columns"""
+        if columns:
+            self.columns = columns
+        step_x = self.card_width + self.GAP
+        step_y = self.card_height + self.GAP
+
+        for position, idx in enumerate(self.visible):
+            tag = self.tags[idx]
+            x = (position % self.columns) * step_x + self.GAP // 2
+            y = (position // self.columns) * step_y + self.GAP // 2
+            old_x, old_y = self.positions[tag]
+            if (x, y) != (old_x, old_y):
+                self.canvas.move(tag, x - old_x, y - old_y)
+                self.positions[tag] = (x, y)
+
+        rows = (len(self.visible) + self.columns - 1) // self.columns
+        self.canvas.configure(
+            width=self.columns * step_x,
+            height=rows * step_y
+        )
+
+    def set_card_shown(self, idx, shown):
+        self.canvas.itemconfigure(self.tags[idx], state='normal' if shown else 'hidden')
+
+
+class LayoutScheduler:
+    """Coalesces <Configure> events of a scrollable view into idle-time layout passes
+
+    Resizing the window or building cards fires <Configure> on the inner frame
+    many times in a row. Instead of recomputing the canvas bounding box for
+    each of them, the first event schedules a single pass with after_idle and
+    the rest are absorbed until that pass has run.
+    """
+
+    def __init__(self, canvas, inner_frame, card_grid=None, margin=0):
+        self.canvas = canvas
+        self.inner_frame = inner_frame
+        self.card_grid = card_grid
+        self.margin = margin
+        self._pending = None
+
+        # Counters for measuring how much work the coalescing saves
+        self.requests = 0
+        self.passes = 0
+
+        inner_frame.bind('<Configure>', self.request)
+        canvas.bind('<Configure>', self.request)
+
+    def request(self, event=None):
+        """Ask for a layout pass on the next idle cycle"""
+        self.requests += 1
+        if self._pending is None:
+            self._pending = self.canvas.after_idle(self.run)
+
+    def run(self):
+        """Reflow the card grid and update the scroll region"""
+        self._pending = None
+        if not self.canvas.winfo_exists():
+            return  # View was torn down before the idle pass ran
+
+        self.passes += 1
+        width = self.canvas.winfo_width()
+        if self.card_grid is not None and width > 1:
+            self.card_grid.reflow(width - self.margin)
+        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+
+
+class FormModel:
+    """In-memory values of a prompt generator form
+
+    Form widgets write into the model as the user edits, so generating a
+    prompt reads plain Python strings instead of querying every widget.
+    Empty fields are stored as '' no matter what placeholder is displayed.
+    """
+
+    def __init__(self, fields):
+        self.fields = {field['id']: field for field in fields}
+        self.values = {field['id']: '' for field in fields}
+        self.listeners = []
+
+    def get(self, field_id):
+        """Raw value of a field"""
+        return self.values[field_id]
+
+    def set(self, field_id, value):
+        """Store a field value and notify listeners if it changed"""
+        if self.values[field_id] == value:
+            return
+        self.values[field_id] = value
+        for listener in self.listeners:
+            listener(field_id, value)
+
+    def data(self):
+        """Stripped values of every field, ready for the template"""
+        return {field_id: value.strip() for field_id, value in self.values.items()}
+
+    def missing_required(self):
+        """Definition of the first required field left empty, if any"""
+        for field_id, field in self.fields.items():
+            if field.get('required') and not self.values[field_id].strip():
+                return field
+        return None
+
+
+class _Leaf(tuple):
+    """(key, value) entry of a PersistentMap"""
+
+    __slots__ = ()
+
+    def __new__(cls, key, value):
+        return tuple.__new__(cls, (key, value))
+
+
+_MISSING = object()
+
+
+class PersistentMap:
+    """Immutable string-keyed map whose versions share structure
+
+    A hash array mapped trie: set() copies only the nodes on the path to the
+    changed key and shares every other node (and every value) with the map
+    it was derived from. That keeps a long history of form snapshots at a
+    cost proportional to the fields that changed, not the size of the form.
+    """
+
+    __slots__ = ('_root', '_size')
+
+    BITS = 5
+    MASK = (1 << BITS) - 1
+    HASH_BITS = 64
+
+    def __init__(self, items=None):
+        self._root = (0, ())  # (bitmap, entries) - entries are (key, value) or child nodes
+        self._size = 0
+        for key, value in (items or {}).items():
+            self._root, added = self._assoc(self._root, 0, self._hash(key), key, value)
+            self._size += added
+
+    @classmethod
+    def _hash(cls, key):
+        return hash(key) & ((1 << cls.HASH_BITS) - 1)
+
+    def __len__(self):
+        return self._size
+
+    def get(self, key, default=None):
+        """Value for key, or default"""
+        node = self._root
+        h = self._hash(key)
+        shift = 0
+        while True:
+            if shift >= self.HASH_BITS:
+                # Collision bucket: leaves whose hashes are identical
+                for entry in node[1]:
+                    if entry[0] == key:
+                        return entry[1]
+                return default
+            bit = 1 << ((h >> shift) & self.MASK)
+            bitmap, entries = node
+            if not bitmap & bit:
+                return default
+            entry = entries[bin(bitmap & (bit - 1)).count('1')]
+            if self._is_leaf(entry):
+                return entry[1] if entry[0] == key else default
+            node = entry
+            shift += self.BITS
+
+    def __getitem__(self, key):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def set(self, key, value):
+        """New map with key set to value, sharing everything else"""
+        root, added = self._assoc(self._root, 0, self._hash(key), key, value)
+        if root is self._root:
+            return self
+        new = PersistentMap.__new__(PersistentMap)
+        new._root = root
+        new._size = self._size + added
+        return new
+
+    def items(self):
+        """All (key, value) pairs, in no particular order"""
+        stack = [self._root]
+        while stack:
+            for entry in stack.pop()[1]:
+                if self._is_leaf(entry):
+                    yield entry[0], entry[1]
+                else:
+                    stack.append(entry)
+
+    def to_dict(self):
+        return dict(self.items())
+
+    @staticmethod
+    def _is_leaf(entry):
+        return entry.__class__ is _Leaf
+
+    def _assoc(self, node, shift, h, key, value):
+        """Node with key set, plus 1 if the key is new (path copying)"""
+        bitmap, entries = node
+        if shift >= self.HASH_BITS:
+            # Hash bits exhausted - linear collision bucket
+            for idx, entry in enumerate(entries):
+                if entry[0] == key:
+                    if entry[1] is value:
+                        return node, 0
+                    return (bitmap, entries[:idx] + (_Leaf(key, value),) + entries[idx + 1:]), 0
+            return (bitmap, entries + (_Leaf(key, value),)), 1
+
+        bit = 1 << ((h >> shift) & self.MASK)
+        idx = bin(bitmap & (bit - 1)).count('1')
+        if not bitmap & bit:
+            return (bitmap | bit, entries[:idx] + (_Leaf(key, value),) + entries[idx:]), 1
+
+        entry = entries[idx]
+        if self._is_leaf(entry):
+            if entry[0] == key:
+                if entry[1] is value:
+                    return node, 0
+                child = _Leaf(key, value)
+                added = 0
+            else:
+                # Push both leaves one level down
+                child = (0, ())
+                child, _ = self._assoc(child, shift + self.BITS, self._hash(entry[0]), entry[0], entry[1])
+                child, added = self._assoc(child, shift + self.BITS, h, key, value)
+        else:
+            child, added = self._assoc(entry, shift + self.BITS, h, key, value)
+            if child is entry:
+                return node, 0
+        return (bitmap, entries[:idx] + (child,) + entries[idx + 1:]), added
+
+
+class FormHistory:
+    """Undo/redo history of a form as PersistentMap snapshots
+
+    Consecutive edits to the same field within GROUP_SECONDS are merged into
+    one step, so undo goes back a burst of typing rather than a keystroke.
+    """
+
+    GROUP_SECONDS = 1.0
+
+    def __init__(self, values, limit=5000):
+        self.current = PersistentMap(values)
+        self.undo_stack = collections.deque(maxlen=limit)  # Oldest steps fall off
+        self.redo_stack = []
+        self._last_field = None
+        self._last_time = 0.0
+
+    def record(self, field_id, value, now=None):
+        """Add an edit to the history"""
+        now = time.monotonic() if now is None else now
+        grouped = field_id == self._last_field and now - self._last_time < self.GROUP_SECONDS
+        if not grouped:
+            self.undo_stack.append(self.current)
+        self.current = self.current.set(field_id, value)
+        self.redo_stack.clear()
+        self._last_field = field_id
+        self._last_time = now
+
+    def undo(self):
+        """Step back, returning the snapshot to restore or None"""
+        if not self.undo_stack:
+            return None
+        self.redo_stack.append(self.current)
+        self.current = self.undo_stack.pop()
+        self._last_field = None
+        return self.current
+
+    def redo(self):
+        """Step forward again, returning the snapshot to restore or None"""
+        if not self.redo_stack:
+            return None
+        self.undo_stack.append(self.current)
+        self.current = self.redo_stack.pop()
+        self._last_field = None
+        return self.current
+
+
+# Diagnostics panel
+DIAGNOSTICS_REFRESH_MS = 2000  # Low enough frequency not to skew what it shows
+DIAGNOSTICS_TIMINGS = 20
+DIAGNOSTICS_TOP_ALLOCATIONS = 10
+
+# Clipboard and toasts
+CLIPBOARD_CHUNK_SIZE = 256 * 1024  # Characters appended per event loop turn
+TOAST_MS = 2500
+BUNDLE_POLL_MS = 50
+
+
+def timed(label):
+    """Log how long an app method takes to the diagnostics timings"""
+    def decorate(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                self.timings.append((label, (time.perf_counter() - start) * 1000))
+        return wrapper
+    return decorate
+
+
 class CometBrowserMasteryApp:
     """Main application class for the Comet Browser Mastery GUI"""
 
-    def __init__(self, root):
+    def __init__(self, root, card_renderer='canvas', theme='brand', ui_scale=1.0, bridge=None):
         self.root = root
         self.root.title("THE EDMUND BOGEN TEAM - Comet Browser Mastery")
         self.root.geometry("1100x800")  # Width to fit all 3 cards with proper spacing
-        self.root.configure(bg='#f4f4f4')  # Light gray brand background
-
-        # Edmund Bogen Brand Color Scheme
-        self.colors = {
-            'primary': '#1a3e5c',      # Navy - PRIMARY brand color (60%)
-            'secondary': '#00a8e1',    # Bright Blue - ACCENT color (10-15%)
-            'accent': '#00a8e1',       # Same as secondary for consistency
-            'bg_light': '#f4f4f4',     # Light gray background
-            'bg_white': '#ffffff',     # White (25-30%)
-            'text_dark': '#000000',    # Black for text
-            'text_light': '#333333',   # Dark gray for body text
-            'success': '#00a8e1',      # Bright blue for CTAs
-            'border': '#e8e8e8'        # Light gray border
-        }
+
+        # Active theme tokens - mutated in place by set_theme so closures
+        # holding this dict always see the current colors
+        self.theme = theme
+        self.colors = dict(THEMES[theme])
+        self.root.configure(bg=self.colors['bg_light'])  # Light gray brand background
+
+        # Shared named fonts, created once in setup_styles
+        self.fonts = {}
+        self.ui_scale = ui_scale
 
         # Current state
         self.current_use_case = None
+        self.current_pack = None
         self.form_widgets = {}
+        self.form_model = None
+        self.placeholder_shown = {}  # Field id -> True while its placeholder is displayed
+        self.form_history = None
+        self.restoring_history = False
+        self.result_windows = []
+        self.prompt_history = collections.deque(maxlen=PROMPT_HISTORY_LIMIT)  # For "save bundle"
+        self.clipboard_job = 0  # Bumped per copy so a newer copy abandons an older one
+
+        # Background asyncio loop for I/O work (see AsyncBridge), if any
+        self.bridge = bridge
+
+        # Diagnostics (Ctrl+Shift+D or F12)
+        self.timings = collections.deque(maxlen=DIAGNOSTICS_TIMINGS)  # (label, ms)
+        self.diagnostics_window = None
+
+        # 'canvas' draws all cards on one canvas, 'widgets' builds a Frame per card
+        self.card_renderer = card_renderer
+        self.layout_scheduler = None
+
+        # Plugin packs only contribute their metadata until opened
+        discover_packs()
+
+        # Search index over the whole catalog, built once
+        self.search_index = SearchIndex(self.menu_cards())
+        self.search_entry = None
+        self.root.bind_all('<Control-k>', self.focus_search)
+        self.root.bind_all('<Control-equal>', lambda e: self.step_ui_scale(1))
+        self.root.bind_all('<Control-plus>', lambda e: self.step_ui_scale(1))
+        self.root.bind_all('<Control-minus>', lambda e: self.step_ui_scale(-1))
+        self.root.bind_all('<Control-0>', lambda e: self.set_ui_scale(1.0))
+        self.root.bind_all('<Control-T>', self.next_theme)  # Ctrl+Shift+T
+        # Form fields also bind these themselves, see bind_undo_keys
+        self.root.bind_all('<Control-z>', self.undo_form_edit)
+        self.root.bind_all('<Control-Z>', self.redo_form_edit)  # Ctrl+Shift+Z
+        self.root.bind_all('<Control-y>', self.redo_form_edit)
+        self.root.bind_all('<Control-D>', self.show_diagnostics)  # Ctrl+Shift+D
+        self.root.bind_all('<F12>', self.show_diagnostics)
+        if self.root.tk.call('tk', 'windowingsystem') == 'aqua':
+            self.root.bind_all('<Command-k>', self.focus_search)
+            self.root.bind_all('<Command-z>', self.undo_form_edit)
+            self.root.bind_all('<Command-Z>', self.redo_form_edit)
 
         # Configure styles
         self.setup_styles()
@@ -420,7 +2280,16 @@ class CometBrowserMasteryApp:
         self.show_main_menu()
 
     def setup_styles(self):
-        """Configure ttk styles"""
+        """Create the shared fonts and configure ttk styles"""
+        if not self.fonts:
+            for name, (family, size, weight) in FONT_SPECS.items():
+                self.fonts[name] = tkfont.Font(
+                    root=self.root,
+                    family=family,
+                    size=round(size * self.ui_scale),
+                    weight=weight
+                )
+
         style = ttk.Style()
         style.theme_use('clam')
 
@@ -431,30 +2300,80 @@ class CometBrowserMasteryApp:
                        borderwidth=2,
                        relief='solid',
                        padding=20,
-                       font=('Helvetica', 11, 'bold'))
+                       font=self.fonts['body_bold'])
 
         style.map('Card.TButton',
-                 background=[('active', '#faf5ff')])
+                 background=[('active', self.colors['card_hover'])])
 
         style.configure('Primary.TButton',
                        background=self.colors['primary'],
                        foreground='white',
                        borderwidth=0,
                        padding=15,
-                       font=('Helvetica', 12, 'bold'))
+                       font=self.fonts['text_bold'])
 
         style.map('Primary.TButton',
                  background=[('active', self.colors['secondary'])])
 
+    def set_ui_scale(self, scale):
+        """Resize the whole UI by reconfiguring the shared fonts"""
+        self.ui_scale = scale
+        for name, (family, size, weight) in FONT_SPECS.items():
+            self.fonts[name].configure(size=round(size * scale))
+
+        # Canvas cards are laid out from font metrics at draw time
+        scheduler = self.layout_scheduler
+        if scheduler is not None and scheduler.card_grid is not None and scheduler.canvas.winfo_exists():
+            scheduler.card_grid.rescale()
+            scheduler.request()
+
+    def step_ui_scale(self, step):
+        """Move to the next larger (1) or smaller (-1) UI scale"""
+        scales = sorted(set(UI_SCALES) | {self.ui_scale})
+        idx = scales.index(self.ui_scale) + step
+        if 0 <= idx < len(scales):
+            self.set_ui_scale(scales[idx])
+
+    def set_theme(self, theme):
+        """Switch color theme and redraw the current view"""
+        self.theme = theme
+        self.colors.update(THEMES[theme])
+        self.root.configure(bg=self.colors['bg_light'])
+        self.setup_styles()
+        self.refresh_view()
+
+    def next_theme(self, event=None):
+        """Switch to the next color theme"""
+        themes = list(THEMES)
+        self.set_theme(themes[(themes.index(self.theme) + 1) % len(themes)])
+
+    def refresh_view(self):
+        """Rebuild the current view, keeping any form input"""
+        if self.current_use_case is not None:
+            values = dict(self.form_model.values)
+            history = self.form_history
+            self.show_prompt_generator(self.current_use_case)
+            for field_id, value in values.items():
+                if value:
+                    self.set_widget_value(field_id, value)
+            self.form_history = history
+        elif self.current_pack is not None:
+            self.show_pack(self.current_pack)
+        else:
+            self.show_main_menu()
+
     def clear_window(self):
         """Clear all widgets from the window"""
         for widget in self.root.winfo_children():
-            widget.destroy()
+            if widget is not self.diagnostics_window:  # Diagnostics stay open across views
+                widget.destroy()
 
+    @timed('build main menu')
     def show_main_menu(self):
         """Show the main menu with use case selection"""
         self.clear_window()
         self.current_use_case = None
+        self.current_pack = None
 
         # Header - Navy Brand Color (OUTSIDE scrollable area for full width)
         header_frame = tk.Frame(self.root, bg=self.colors['primary'], padx=40, pady=30)
@@ -465,11 +2384,6 @@ class CometBrowserMasteryApp:
         scrollbar = ttk.Scrollbar(self.root, orient="vertical", command=main_canvas.yview)
         scrollable_frame = tk.Frame(main_canvas, bg=self.colors['bg_light'])
 
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: main_canvas.configure(scrollregion=main_canvas.bbox("all"))
-        )
-
         # Fill width properly
         main_canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         main_canvas.configure(yscrollcommand=scrollbar.set)
@@ -477,7 +2391,7 @@ class CometBrowserMasteryApp:
         title_label = tk.Label(
             header_frame,
             text="THE EDMUND BOGEN TEAM",
-            font=('Helvetica', 32, 'bold'),
+            font=self.fonts['display'],
             bg=self.colors['primary'],
             fg='white'
         )
@@ -486,7 +2400,7 @@ class CometBrowserMasteryApp:
         subtitle_label = tk.Label(
             header_frame,
             text="COMET BROWSER MASTERY - AI Prompt Generator for Real Estate Professionals",
-            font=('Helvetica', 13),
+            font=self.fonts['subtitle'],
             bg=self.colors['primary'],
             fg='white'
         )
@@ -499,7 +2413,7 @@ class CometBrowserMasteryApp:
         welcome_title = tk.Label(
             welcome_frame,
             text="WELCOME TO YOUR AI ASSISTANT CUSTOMIZER",
-            font=('Helvetica', 18, 'bold'),
+            font=self.fonts['heading'],
             bg=self.colors['bg_white'],
             fg=self.colors['text_dark']
         )
@@ -510,7 +2424,7 @@ class CometBrowserMasteryApp:
             text=("This interactive tool helps you generate perfectly customized AI prompts for your specific\n"
                   "real estate situations. Simply select a use case below, fill in your details, and get\n"
                   "a ready-to-use prompt that you can copy directly into any agentic browser (Comet, ChatGPT, Claude)."),
-            font=('Helvetica', 12),
+            font=self.fonts['text'],
             bg=self.colors['bg_white'],
             fg=self.colors['text_light'],
             justify='left'
@@ -521,14 +2435,14 @@ class CometBrowserMasteryApp:
         accent_bar = tk.Frame(welcome_frame, bg=self.colors['secondary'], width=4)
         accent_bar.pack(side='left', fill='y', pady=10)
 
-        tip_frame = tk.Frame(welcome_frame, bg='#e8f4f8', relief='flat', borderwidth=0)
+        tip_frame = tk.Frame(welcome_frame, bg=self.colors['tip_bg'], relief='flat', borderwidth=0)
         tip_frame.pack(fill='x', pady=10)
 
         tip_label = tk.Label(
             tip_frame,
             text="PRO TIP: These prompts work best when you provide specific details.\nThe more context you add, the better your AI assistant can help you.",
-            font=('Helvetica', 11),
-            bg='#e8f4f8',
+            font=self.fonts['body'],
+            bg=self.colors['tip_bg'],
             fg=self.colors['primary'],
             justify='left',
             padx=20,
@@ -540,27 +2454,84 @@ class CometBrowserMasteryApp:
         use_cases_title = tk.Label(
             scrollable_frame,
             text="CHOOSE YOUR USE CASE",
-            font=('Helvetica', 22, 'bold'),
+            font=self.fonts['section'],
             bg=self.colors['bg_light'],
             fg=self.colors['text_dark']
         )
         use_cases_title.pack(pady=(20, 20))
 
-        # Use cases grid
-        grid_frame = tk.Frame(scrollable_frame, bg=self.colors['bg_light'])
-        grid_frame.pack(padx=40, pady=20)
+        # Search box - filters the cards below in place
+        search_frame = tk.Frame(scrollable_frame, bg=self.colors['bg_light'])
+        search_frame.pack(fill='x', padx=55)
 
-        # Create cards in grid (3 columns)
-        for idx, use_case in enumerate(USE_CASES):
-            row = idx // 3
-            col = idx % 3
+        search_label = tk.Label(
+            search_frame,
+            text="SEARCH",
+            font=self.fonts['body_bold'],
+            bg=self.colors['bg_light'],
+            fg=self.colors['primary']
+        )
+        search_label.pack(side='left', padx=(0, 10))
 
-            card = self.create_use_case_card(grid_frame, use_case)
-            card.grid(row=row, column=col, padx=15, pady=15, sticky='nsew')
+        search_var = tk.StringVar(search_frame)
+        self.search_entry = tk.Entry(
+            search_frame,
+            textvariable=search_var,
+            font=self.fonts['text'],
+            relief='solid',
+            borderwidth=1
+        )
+        self.search_entry.pack(side='left', fill='x', expand=True, ipady=4)
 
-        # Configure grid weights
-        for i in range(3):
-            grid_frame.columnconfigure(i, weight=1)
+        search_count = tk.Label(
+            search_frame,
+            text="",
+            font=self.fonts['small'],
+            bg=self.colors['bg_light'],
+            fg=self.colors['text_light']
+        )
+        search_count.pack(side='left', padx=(10, 0))
+
+        # Pipelines chain several use cases from a JSON definition
+        pipeline_button = tk.Label(
+            search_frame,
+            text="RUN PIPELINE →",  # ALL CAPS for CTAs
+            font=self.fonts['body_bold'],
+            bg=self.colors['primary'],
+            fg='white',
+            cursor='hand2',
+            padx=15,
+            pady=6
+        )
+        pipeline_button.pack(side='right', padx=(15, 0))
+        pipeline_button.bind('<Button-1>', lambda e: self.open_pipeline())
+
+        # Use cases grid (3 columns, reflowed to the window width)
+        cards = self.search_index.cards
+        if self.card_renderer == 'canvas':
+            card_grid = CanvasCardGrid(self, scrollable_frame, cards)
+        else:
+            card_grid = WidgetCardGrid(self, scrollable_frame, cards)
+        card_grid.widget.pack(padx=40, pady=20)
+        self.layout_scheduler = LayoutScheduler(main_canvas, scrollable_frame, card_grid, margin=80)
+
+        def on_search(*args):
+            query = search_var.get()
+            matches = self.search_index.search(query)
+            card_grid.filter(matches)
+            search_count.configure(text=f"{len(matches)} of {len(cards)}" if query.strip() else "")
+
+        def on_search_return(e):
+            # Enter opens the best match
+            if card_grid.visible:
+                self.open_card(cards[card_grid.visible[0]])
+
+        def on_search_escape(e):
+            search_var.set('')
+
+        search_var.trace_add('write', on_search)
+        self.search_entry.bind('<Return>', on_search_return)
+        self.search_entry.bind('<Escape>', on_search_escape)
 
         # About section - Navy brand color
         about_frame = tk.Frame(scrollable_frame, bg=self.colors['primary'], padx=40, pady=30)
@@ -569,7 +2540,7 @@ class CometBrowserMasteryApp:
         about_title = tk.Label(
             about_frame,
             text="ABOUT THE EDMUND BOGEN TEAM",
-            font=('Helvetica', 18, 'bold'),
+            font=self.fonts['heading'],
             bg=self.colors['primary'],
             fg='white'
         )
@@ -580,7 +2551,7 @@ class CometBrowserMasteryApp:
             text=("The Edmund Bogen Team at Douglas Elliman Real Estate serves South Florida from Palm Beach to Miami.\n"
                   "Luxury Real Estate Advisor, Coach & Speaker specializing in professional luxury properties.\n"
                   "This tool leverages AI to help real estate professionals 10x their productivity."),
-            font=('Helvetica', 12),
+            font=self.fonts['text'],
             bg=self.colors['primary'],
             fg='white',
             justify='left'
@@ -592,9 +2563,9 @@ class CometBrowserMasteryApp:
             text=("🔒 SECURITY NOTICE: Never input sensitive client information (SSNs, financial details,\n"
                   "legal documents) into AI tools. Use this generator for templates and frameworks, then add\n"
                   "client-specific details in your secure systems."),
-            font=('Helvetica', 10),
+            font=self.fonts['small'],
             bg=self.colors['primary'],
-            fg='#e8e8e8',
+            fg=self.colors['text_muted'],
             justify='left'
         )
         security_label.pack(anchor='w')
@@ -606,7 +2577,7 @@ class CometBrowserMasteryApp:
         footer_label = tk.Label(
             footer_frame,
             text="© 2025 THE EDMUND BOGEN TEAM AT DOUGLAS ELLIMAN REAL ESTATE | Comet Browser Mastery",
-            font=('Helvetica', 10),
+            font=self.fonts['small'],
             bg=self.colors['primary'],
             fg='white'
         )
@@ -626,6 +2597,112 @@ class CometBrowserMasteryApp:
         scrollable_frame.bind_all("<Button-4>", lambda e: main_canvas.yview_scroll(-1, "units"))  # Linux scroll up
         scrollable_frame.bind_all("<Button-5>", lambda e: main_canvas.yview_scroll(1, "units"))  # Linux scroll down
 
+    def focus_search(self, event=None):
+        """Jump to the main menu search box (Ctrl/Cmd+K)"""
+        if self.search_entry is not None and self.search_entry.winfo_exists():
+            self.search_entry.focus_set()
+            self.search_entry.select_range(0, 'end')
+
+    def menu_cards(self):
+        """Built-in use cases followed by one card per installed pack"""
+        return USE_CASES + [pack.card() for pack in PACKS.values()]
+
+    def open_card(self, card):
+        """Open a card from a card grid"""
+        if 'pack' in card:
+            self.show_pack(card['pack'])
+        else:
+            self.show_prompt_generator(card)
+
+    def go_back(self):
+        """Return from a prompt generator to the menu it was opened from"""
+        if self.current_pack is not None:
+            self.show_pack(self.current_pack)
+        else:
+            self.show_main_menu()
+
+    @timed('build pack view')
+    def show_pack(self, pack):
+        """Show the use cases of a plugin pack, importing it on first open"""
+        try:
+            use_cases = pack.load()
+        except Exception as exc:
+            messagebox.showerror(
+                "Pack Unavailable",
+                f"Could not load {pack.title}:\n{exc}"
+            )
+            return
+
+        self.clear_window()
+        self.current_use_case = None
+        self.current_pack = pack
+
+        # Create main container with scrollbar
+        main_canvas = tk.Canvas(self.root, bg=self.colors['bg_light'], highlightthickness=0)
+        scrollbar = ttk.Scrollbar(self.root, orient="vertical", command=main_canvas.yview)
+        scrollable_frame = tk.Frame(main_canvas, bg=self.colors['bg_light'])
+
+        main_canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        main_canvas.configure(yscrollcommand=scrollbar.set)
+
+        # Back button - Brand styling
+        back_button = tk.Button(
+            scrollable_frame,
+            text="← BACK TO USE CASES",  # ALL CAPS
+            font=self.fonts['body_bold'],
+            bg=self.colors['bg_white'],
+            fg=self.colors['primary'],  # Navy
+            activebackground=self.colors['bg_light'],
+            activeforeground=self.colors['secondary'],  # Bright blue on hover
+            relief='flat',
+            cursor='hand2',
+            command=self.show_main_menu,
+            padx=20,
+            pady=10
+        )
+        back_button.pack(anchor='w', padx=40, pady=(20, 10))
+
+        # Pack header
+        title_label = tk.Label(
+            scrollable_frame,
+            text=f"{pack.icon} {pack.title.upper()}",  # ALL CAPS per brand
+            font=self.fonts['section'],
+            bg=self.colors['bg_light'],
+            fg=self.colors['text_dark']
+        )
+        title_label.pack(pady=(20, 5))
+
+        desc_label = tk.Label(
+            scrollable_frame,
+            text=pack.description,
+            font=self.fonts['text'],
+            bg=self.colors['bg_light'],
+            fg=self.colors['text_light']
+        )
+        desc_label.pack()
+
+        # Use cases grid
+        if self.card_renderer == 'canvas':
+            card_grid = CanvasCardGrid(self, scrollable_frame, use_cases)
+        else:
+            card_grid = WidgetCardGrid(self, scrollable_frame, use_cases)
+        card_grid.widget.pack(padx=40, pady=20)
+        self.layout_scheduler = LayoutScheduler(main_canvas, scrollable_frame, card_grid, margin=80)
+
+        # Pack canvas and scrollbar
+        main_canvas.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+
+        # Bind mousewheel - macOS compatible
+        def on_mousewheel(event):
+            # macOS uses event.delta directly
+            main_canvas.yview_scroll(int(-1 * event.delta), "units")
+
+        # Bind for both macOS and Windows/Linux
+        scrollable_frame.bind_all("<MouseWheel>", on_mousewheel)  # Windows/macOS
+        scrollable_frame.bind_all("<Button-4>", lambda e: main_canvas.yview_scroll(-1, "units"))  # Linux scroll up
+        scrollable_frame.bind_all("<Button-5>", lambda e: main_canvas.yview_scroll(1, "units"))  # Linux scroll down
+
     def create_use_case_card(self, parent, use_case):
         """Create a use case card button"""
         card_frame = tk.Frame(
@@ -643,7 +2720,7 @@ class CometBrowserMasteryApp:
         icon_label = tk.Label(
             card_frame,
             text=use_case['icon'],
-            font=('Helvetica', 40),
+            font=self.fonts['icon'],
             bg=self.colors['bg_white']
         )
         icon_label.pack(pady=(20, 10))
@@ -652,7 +2729,7 @@ class CometBrowserMasteryApp:
         title_label = tk.Label(
             card_frame,
             text=use_case['title'].upper(),  # ALL CAPS per brand guidelines
-            font=('Helvetica', 13, 'bold'),
+            font=self.fonts['card_title'],
             bg=self.colors['bg_white'],
             fg=self.colors['primary'],  # Navy
             wraplength=250
@@ -663,7 +2740,7 @@ class CometBrowserMasteryApp:
         desc_label = tk.Label(
             card_frame,
             text=use_case['description'],
-            font=('Helvetica', 10),
+            font=self.fonts['small'],
             bg=self.colors['bg_white'],
             fg=self.colors['text_light'],
             wraplength=250,
@@ -674,9 +2751,9 @@ class CometBrowserMasteryApp:
         # Button using Label (better macOS compatibility)
         button = tk.Label(
             card_frame,
-            text="GENERATE PROMPT →",  # ALL CAPS for CTAs
-            font=('Helvetica', 11, 'bold'),
-            bg='#00a8e1',  # Bright blue
+            text="BROWSE TEMPLATES →" if 'pack' in use_case else "GENERATE PROMPT →",  # ALL CAPS for CTAs
+            font=self.fonts['body_bold'],
+            bg=self.colors['secondary'],  # Bright blue
             fg='white',
             cursor='hand2',
             pady=12
@@ -684,16 +2761,16 @@ class CometBrowserMasteryApp:
         button.pack(pady=(5, 20), padx=20, fill='x')
 
         # Make label clickable
-        button.bind('<Button-1>', lambda e, uc=use_case: self.show_prompt_generator(uc))
+        button.bind('<Button-1>', lambda e, uc=use_case: self.open_card(uc))
 
         # Hover effects - Bright blue accent
         def on_enter(e):
-            card_frame.configure(highlightbackground='#00a8e1')  # Bright blue
-            button.configure(bg='#0090c5')  # Darker blue on hover
+            card_frame.configure(highlightbackground=self.colors['secondary'])  # Bright blue
+            button.configure(bg=self.colors['accent_hover'])  # Darker blue on hover
 
         def on_leave(e):
             card_frame.configure(highlightbackground=self.colors['border'])
-            button.configure(bg='#00a8e1')  # Back to bright blue
+            button.configure(bg=self.colors['secondary'])  # Back to bright blue
 
         card_frame.bind('<Enter>', on_enter)
         card_frame.bind('<Leave>', on_leave)
@@ -703,21 +2780,21 @@ class CometBrowserMasteryApp:
 
         return card_frame
 
+    @timed('build prompt form')
     def show_prompt_generator(self, use_case):
         """Show the prompt generator form for a specific use case"""
         self.clear_window()
         self.current_use_case = use_case
         self.form_widgets = {}
+        self.form_model = FormModel(use_case['fields'])
+        self.placeholder_shown = {}
 
         # Create main container with scrollbar
         main_canvas = tk.Canvas(self.root, bg=self.colors['bg_light'], highlightthickness=0)
         scrollbar = ttk.Scrollbar(self.root, orient="vertical", command=main_canvas.yview)
         scrollable_frame = tk.Frame(main_canvas, bg=self.colors['bg_light'])
 
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: main_canvas.configure(scrollregion=main_canvas.bbox("all"))
-        )
+        self.layout_scheduler = LayoutScheduler(main_canvas, scrollable_frame)
 
         # Fill width properly
         main_canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
@@ -727,14 +2804,14 @@ class CometBrowserMasteryApp:
         back_button = tk.Button(
             scrollable_frame,
             text="← BACK TO USE CASES",  # ALL CAPS
-            font=('Helvetica', 11, 'bold'),
+            font=self.fonts['body_bold'],
             bg=self.colors['bg_white'],
             fg=self.colors['primary'],  # Navy
-            activebackground='#f4f4f4',
+            activebackground=self.colors['bg_light'],
             activeforeground=self.colors['secondary'],  # Bright blue on hover
             relief='flat',
             cursor='hand2',
-            command=self.show_main_menu,
+            command=self.go_back,
             padx=20,
             pady=10
         )
@@ -751,7 +2828,7 @@ class CometBrowserMasteryApp:
         icon_label = tk.Label(
             header_container,
             text=use_case['icon'],
-            font=('Helvetica', 50),
+            font=self.fonts['icon_large'],
             bg=self.colors['bg_white']
         )
         icon_label.pack()
@@ -759,7 +2836,7 @@ class CometBrowserMasteryApp:
         title_label = tk.Label(
             header_container,
             text=use_case['title'].upper(),  # ALL CAPS per brand
-            font=('Helvetica', 24, 'bold'),
+            font=self.fonts['page_title'],
             bg=self.colors['bg_white'],
             fg=self.colors['primary']  # Navy
         )
@@ -768,7 +2845,7 @@ class CometBrowserMasteryApp:
         desc_label = tk.Label(
             header_container,
             text=use_case['description'],
-            font=('Helvetica', 14),
+            font=self.fonts['lead'],
             bg=self.colors['bg_white'],
             fg=self.colors['text_light']
         )
@@ -781,12 +2858,16 @@ class CometBrowserMasteryApp:
         for field in use_case['fields']:
             self.create_form_field(fields_container, field)
 
+        # Undo/redo across all fields
+        self.form_history = FormHistory(self.form_model.values)
+        self.form_model.listeners.append(self.on_form_edit)
+
         # Generate button using Label (better macOS compatibility)
         generate_button = tk.Label(
             form_frame,
             text="GENERATE CUSTOM PROMPT",  # ALL CAPS for CTAs
-            font=('Helvetica', 13, 'bold'),
-            bg='#00a8e1',  # Bright blue
+            font=self.fonts['card_title'],
+            bg=self.colors['secondary'],  # Bright blue
             fg='white',
             cursor='hand2',
             pady=15
@@ -798,10 +2879,10 @@ class CometBrowserMasteryApp:
 
         # Hover effect
         def on_hover(e):
-            generate_button.configure(bg='#0090c5')
+            generate_button.configure(bg=self.colors['accent_hover'])
 
         def on_leave(e):
-            generate_button.configure(bg='#00a8e1')
+            generate_button.configure(bg=self.colors['secondary'])
 
         generate_button.bind('<Enter>', on_hover)
         generate_button.bind('<Leave>', on_leave)
@@ -821,10 +2902,19 @@ class CometBrowserMasteryApp:
         scrollable_frame.bind_all("<Button-5>", lambda e: main_canvas.yview_scroll(1, "units"))  # Linux scroll down
 
     def create_form_field(self, parent, field):
-        """Create a form field widget based on field type"""
+        """Create a form field widget based on field type
+
+        Widgets push their text into self.form_model as the user edits, so
+        the placeholder shown in an empty field never reaches the model.
+        """
         field_frame = tk.Frame(parent, bg=self.colors['bg_white'])
         field_frame.pack(fill='x', pady=10)
 
+        field_id = field['id']
+        model = self.form_model
+        placeholder = field.get('placeholder', '')
+        self.placeholder_shown[field_id] = False
+
         # Label
         label_text = field['label']
         if field.get('required'):
@@ -833,64 +2923,104 @@ class CometBrowserMasteryApp:
         label = tk.Label(
             field_frame,
             text=label_text,
-            font=('Helvetica', 11, 'bold'),
+            font=self.fonts['body_bold'],
             bg=self.colors['bg_white'],
             fg=self.colors['text_dark']
         )
         label.pack(anchor='w', pady=(0, 5))
 
         # Widget based on type
-        if field['type'] == 'select':
+        if is_typeahead_field(field):
+            widget = self.create_typeahead_select(field_frame, field)
+        elif field['type'] == 'select':
+            variable = tk.StringVar(field_frame)
             widget = ttk.Combobox(
                 field_frame,
+                textvariable=variable,
                 values=field.get('options', []),
-                font=('Helvetica', 11),
+                font=self.fonts['body'],
                 state='readonly'
             )
-            widget.set(field.get('placeholder', 'Select...'))
+            self.placeholder_shown[field_id] = True
+            variable.set(placeholder or 'Select...')
+
+            def on_select(e, fid=field_id, var=variable):
+                self.placeholder_shown[fid] = False
+                model.set(fid, var.get())
+
+            widget.bind('<<ComboboxSelected>>', on_select)
         elif field['type'] == 'textarea':
             widget = scrolledtext.ScrolledText(
                 field_frame,
                 height=4,
-                font=('Helvetica', 11),
+                font=self.fonts['body'],
                 relief='solid',
                 borderwidth=1,
                 wrap='word'
             )
-            if field.get('placeholder'):
-                widget.insert('1.0', field['placeholder'])
+
+            # Text has no textvariable, so sync on the modified flag instead
+            def on_modified(e, w=widget, fid=field_id):
+                if w.edit_modified():
+                    w.edit_modified(False)
+                    if not self.placeholder_shown[fid]:
+                        model.set(fid, w.get('1.0', 'end-1c'))
+
+            widget.bind('<<Modified>>', on_modified)
+
+            if placeholder:
+                self.placeholder_shown[field_id] = True
+                widget.insert('1.0', placeholder)
                 widget.configure(fg=self.colors['text_light'])
 
-                def on_focus_in(e, w=widget, ph=field['placeholder']):
-                    if w.get('1.0', 'end-1c') == ph:
+                def on_focus_in(e, w=widget, fid=field_id):
+                    if self.placeholder_shown[fid]:
+                        self.placeholder_shown[fid] = False
                         w.delete('1.0', 'end')
                         w.configure(fg=self.colors['text_dark'])
 
-                def on_focus_out(e, w=widget, ph=field['placeholder']):
-                    if not w.get('1.0', 'end-1c').strip():
+                def on_focus_out(e, w=widget, fid=field_id, ph=placeholder):
+                    if not model.get(fid).strip():
+                        model.set(fid, '')
+                        self.placeholder_shown[fid] = True
+                        w.delete('1.0', 'end')
                         w.insert('1.0', ph)
                         w.configure(fg=self.colors['text_light'])
 
                 widget.bind('<FocusIn>', on_focus_in)
                 widget.bind('<FocusOut>', on_focus_out)
         else:  # text or number
+            variable = tk.StringVar(field_frame)
             widget = tk.Entry(
                 field_frame,
-                font=('Helvetica', 11),
+                textvariable=variable,
+                font=self.fonts['body'],
                 relief='solid',
                 borderwidth=1
             )
-            if field.get('placeholder'):
-                widget.insert(0, field['placeholder'])
+
+            def on_write(*args, fid=field_id, var=variable):
+                if not self.placeholder_shown[fid]:
+                    model.set(fid, var.get())
+
+            variable.trace_add('write', on_write)
+
+            if placeholder:
+                self.placeholder_shown[field_id] = True
+                variable.set(placeholder)
                 widget.configure(fg=self.colors['text_light'])
 
-                def on_focus_in(e, w=widget, ph=field['placeholder']):
-                    if w.get() == ph:
+                def on_focus_in(e, w=widget, fid=field_id):
+                    if self.placeholder_shown[fid]:
+                        self.placeholder_shown[fid] = False
                         w.delete(0, 'end')
                         w.configure(fg=self.colors['text_dark'])
 
-                def on_focus_out(e, w=widget, ph=field['placeholder']):
-                    if not w.get().strip():
+                def on_focus_out(e, w=widget, fid=field_id, ph=placeholder):
+                    if not model.get(fid).strip():
+                        model.set(fid, '')
+                        self.placeholder_shown[fid] = True
+                        w.delete(0, 'end')
                         w.insert(0, ph)
                         w.configure(fg=self.colors['text_light'])
 
@@ -898,61 +3028,389 @@ class CometBrowserMasteryApp:
                 widget.bind('<FocusOut>', on_focus_out)
 
         widget.pack(fill='x')
-        self.form_widgets[field['id']] = widget
+        self.form_widgets[field_id] = widget
+        self.bind_undo_keys(widget)
+
+    def bind_undo_keys(self, widget):
+        """Handle the form undo/redo keys on a field before its class bindings
+
+        The app-wide bindings run after the Entry/Text class bindings, and
+        on X11 those treat Ctrl+Y as paste. Handlers bound on the widget run
+        first and return 'break', so the class never sees the key.
+        """
+        keys = [('<Control-z>', self.undo_form_edit),
+                ('<Control-Z>', self.redo_form_edit),
+                ('<Control-y>', self.redo_form_edit)]
+        if widget.tk.call('tk', 'windowingsystem') == 'aqua':
+            keys += [('<Command-z>', self.undo_form_edit), ('<Command-Z>', self.redo_form_edit)]
+        for sequence, handler in keys:
+            widget.bind(sequence, handler)
+
+    def create_typeahead_select(self, parent, field):
+        """Editable combobox that lists the options matching what was typed
+
+        The field's value in the model is only set once the text names one
+        of the options (ignoring case). Leaving the field with text that
+        names no option shows it in the error color.
+        """
+        field_id = field['id']
+        model = self.form_model
+        placeholder = field.get('placeholder', 'Type to search...')
+        options = {}  # Holds the OptionIndex once it has been built
+
+        def get_index():
+            if 'index' not in options:
+                if 'optionsFile' in field:
+                    options['index'] = load_option_index(field['optionsFile'])
+                else:
+                    options['index'] = OptionIndex(field.get('options', []))
+            return options['index']
+
+        variable = tk.StringVar(parent)
+        widget = ttk.Combobox(
+            parent,
+            textvariable=variable,
+            font=self.fonts['body']
+        )
+
+        # Opening the dropdown only ever loads the top matches
+        def on_post():
+            if self.placeholder_shown[field_id]:
+                widget.configure(values=get_index().prefix(''))
+            else:
+                widget.configure(values=get_index().prefix(variable.get()))
+
+        widget.configure(postcommand=on_post)
+
+        def on_write(*args):
+            if self.placeholder_shown[field_id]:
+                return
+            model.set(field_id, get_index().lookup(variable.get()) or '')
+
+        variable.trace_add('write', on_write)
+
+        def on_key(e):
+            if not self.placeholder_shown[field_id]:
+                widget.configure(values=get_index().prefix(variable.get()))
+
+        widget.bind('<KeyRelease>', on_key)
+
+        # Picking from the dropdown without typing first: the placeholder may
+        # still be flagged, so on_write would ignore the chosen value
+        def on_select(e):
+            self.placeholder_shown[field_id] = False
+            widget.configure(foreground=self.colors['text_dark'])
+            on_write()
+
+        widget.bind('<<ComboboxSelected>>', on_select)
+
+        self.placeholder_shown[field_id] = True
+        variable.set(placeholder)
+        widget.configure(foreground=self.colors['text_light'])
+
+        def on_focus_in(e):
+            if self.placeholder_shown[field_id]:
+                self.placeholder_shown[field_id] = False
+                variable.set('')
+            widget.configure(foreground=self.colors['text_dark'])
+
+        def popdown_posted():
+            popdown = widget.tk.call('ttk::combobox::PopdownWindow', widget)
+            return bool(widget.tk.call('winfo', 'ismapped', popdown))
+
+        def on_focus_out(e):
+            # The open dropdown takes focus; that isn't leaving the field
+            if popdown_posted():
+                return
+            text = variable.get()
+            if not text.strip():
+                self.placeholder_shown[field_id] = True
+                variable.set(placeholder)
+                widget.configure(foreground=self.colors['text_light'])
+                return
+            option = get_index().lookup(text)
+            if option is None:
+                widget.configure(foreground=self.colors['error'])
+            elif option != text:
+                variable.set(option)  # Show the option as listed
+
+        widget.bind('<FocusIn>', on_focus_in)
+        widget.bind('<FocusOut>', on_focus_out)
+        return widget
+
+    def set_widget_value(self, field_id, value):
+        """Show a value in a form field and store it in the model
+
+        An empty value brings back the field's placeholder, unless the field
+        has keyboard focus and takes typing: no FocusIn follows to clear
+        the placeholder, so typed text would land after it.
+        """
+        field = self.form_model.fields[field_id]
+        widget = self.form_widgets[field_id]
+        placeholder = field.get('placeholder', '')
+        typeahead = is_typeahead_field(field)
+        if field['type'] == 'select' and not placeholder:
+            placeholder = 'Type to search...' if typeahead else 'Select...'
+        typed_into = field['type'] != 'select' or typeahead
+        focused = str(widget) == str(widget.tk.call('focus'))
+        show_placeholder = not value and bool(placeholder) and not (typed_into and focused)
+
+        self.placeholder_shown[field_id] = show_placeholder
+        text = placeholder if show_placeholder else value
+        color = self.colors['text_light'] if show_placeholder else self.colors['text_dark']
 
-    def get_field_value(self, field_id, widget, placeholder=''):
-        """Get the value from a form widget"""
         if isinstance(widget, scrolledtext.ScrolledText):
-            value = widget.get('1.0', 'end-1c').strip()
-            return value if value != placeholder else ''
+            widget.delete('1.0', 'end')
+            widget.insert('1.0', text)
+            widget.configure(fg=color)
         elif isinstance(widget, ttk.Combobox):
-            value = widget.get()
-            return value if value != 'Select...' else ''
+            widget.set(text)
+            if typeahead:
+                widget.configure(foreground=color)
         else:
-            value = widget.get().strip()
-            return value if value != placeholder else ''
+            widget.delete(0, 'end')
+            widget.insert(0, text)
+            widget.configure(fg=color)
+
+        self.form_model.set(field_id, value)
+
+    def on_form_edit(self, field_id, value):
+        """Record form edits made by the user in the undo history"""
+        if not self.restoring_history:
+            self.form_history.record(field_id, value)
+
+    def restore_form_snapshot(self, snapshot):
+        """Put the fields that differ from a history snapshot back"""
+        self.restoring_history = True
+        try:
+            for field_id, value in snapshot.items():
+                if self.form_model.get(field_id) != value:
+                    self.set_widget_value(field_id, value)
+        finally:
+            self.restoring_history = False
+
+    def undo_form_edit(self, event=None):
+        """Undo the last edit on the prompt generator form (Ctrl/Cmd+Z)"""
+        if self.current_use_case is None:
+            return
+        snapshot = self.form_history.undo()
+        if snapshot is not None:
+            self.restore_form_snapshot(snapshot)
+        return 'break'
+
+    def redo_form_edit(self, event=None):
+        """Redo an undone edit (Ctrl/Cmd+Shift+Z or Ctrl+Y)"""
+        if self.current_use_case is None:
+            return
+        snapshot = self.form_history.redo()
+        if snapshot is not None:
+            self.restore_form_snapshot(snapshot)
+        return 'break'
 
     def generate_prompt(self):
         """Generate the prompt from form data"""
-        # Collect form data
-        form_data = {}
-        for field_id, widget in self.form_widgets.items():
-            # Find the field definition
-            field_def = next((f for f in self.current_use_case['fields'] if f['id'] == field_id), None)
-            placeholder = field_def.get('placeholder', '') if field_def else ''
-            value = self.get_field_value(field_id, widget, placeholder)
-
-            # Check required fields
-            if field_def and field_def.get('required') and not value:
-                messagebox.showwarning(
-                    "Missing Required Field",
-                    f"Please fill in: {field_def['label']}"
-                )
-                return
-
-            form_data[field_id] = value
+        # Check required fields
+        missing = self.form_model.missing_required()
+        if missing:
+            messagebox.showwarning(
+                "Missing Required Field",
+                f"Please fill in: {missing['label']}"
+            )
+            return
 
         # Process template
-        prompt = self.current_use_case['promptTemplate']
+        start = time.perf_counter()
+        prompt = render_template(self.current_use_case['promptTemplate'], self.form_model.data())
+        self.timings.append(('render prompt', (time.perf_counter() - start) * 1000))
 
-        # Simple template replacement
-        for field_id, value in form_data.items():
-            prompt = re.sub(f'{{{{{field_id}}}}}', value, prompt)
+        # Show result
+        prompt = prompt.strip()
+        self.record_prompt(self.current_use_case['title'], prompt)
+        self.show_prompt_result(prompt)
+
+    def open_pipeline(self):
+        """Pick a pipeline definition and ask for its inputs"""
+        path = filedialog.askopenfilename(
+            title="Open Pipeline",
+            filetypes=[("Pipeline definitions", "*.json"), ("All files", "*")]
+        )
+        if not path:
+            return
+        try:
+            pipeline = load_pipeline(path)
+        except (OSError, ValueError) as exc:
+            messagebox.showerror("Invalid Pipeline", str(exc))
+            return
+
+        dialog = tk.Toplevel(self.root)
+        dialog.title(pipeline.get('name', "Run Pipeline"))
+        dialog.configure(bg=self.colors['bg_white'], padx=30, pady=20)
 
-        # Handle conditional blocks
-        def replace_conditional(match):
-            field_id = match.group(1)
-            content = match.group(2)
-            return content if form_data.get(field_id) else ''
+        title_label = tk.Label(
+            dialog,
+            text=pipeline.get('name', os.path.basename(path)).upper(),  # ALL CAPS per brand
+            font=self.fonts['heading'],
+            bg=self.colors['bg_white'],
+            fg=self.colors['primary']
+        )
+        title_label.pack(anchor='w', pady=(0, 5))
+
+        steps_label = tk.Label(
+            dialog,
+            text=" → ".join(step['id'] for step in pipeline['steps']),
+            font=self.fonts['body'],
+            bg=self.colors['bg_white'],
+            fg=self.colors['text_light']
+        )
+        steps_label.pack(anchor='w', pady=(0, 15))
+
+        entries = {}
+        for name in pipeline_inputs(pipeline):
+            label = tk.Label(
+                dialog,
+                text=name,
+                font=self.fonts['body_bold'],
+                bg=self.colors['bg_white'],
+                fg=self.colors['text_dark']
+            )
+            label.pack(anchor='w')
+            entry = tk.Entry(dialog, font=self.fonts['body'], relief='solid', borderwidth=1, width=50)
+            entry.pack(fill='x', pady=(0, 10))
+            entries[name] = entry
+
+        def on_run(e=None):
+            inputs = {name: entry.get().strip() for name, entry in entries.items()}
+            dialog.destroy()
+            self.run_pipeline_in_gui(pipeline, inputs)
+
+        run_button = tk.Label(
+            dialog,
+            text="RUN PIPELINE",  # ALL CAPS for CTAs
+            font=self.fonts['card_title'],
+            bg=self.colors['secondary'],
+            fg='white',
+            cursor='hand2',
+            pady=12
+        )
+        run_button.pack(fill='x', pady=(10, 0))
+        run_button.bind('<Button-1>', on_run)
+        run_button.bind('<Enter>', lambda e: run_button.configure(bg=self.colors['accent_hover']))
+        run_button.bind('<Leave>', lambda e: run_button.configure(bg=self.colors['secondary']))
+        dialog.bind('<Return>', on_run)
+
+    def run_pipeline_in_gui(self, pipeline, inputs):
+        """Run a pipeline and show every step's prompt in one result window"""
+        start = time.perf_counter()
+        results = run_pipeline(pipeline, inputs)
+        total = (time.perf_counter() - start) * 1000
+        self.timings.append((f"pipeline {pipeline.get('name', '')}".strip(), total))
+
+        sections = []
+        for result in results:
+            header = f"=== {result['id'].upper()} ({result['use_case']}) - {result['ms']:.1f} ms ==="
+            sections.append(f"{header}\n\n{result.get('prompt') or 'ERROR: ' + result['error']}")
+        sections.append(f"Total: {total:.1f} ms")
+        prompt = '\n\n'.join(sections)
+        self.record_prompt(pipeline.get('name') or 'Pipeline', prompt)
+        self.show_prompt_result(prompt)
+
+    def record_prompt(self, title, prompt):
+        """Keep a generated prompt in the session history"""
+        self.prompt_history.append({'title': title, 'time': time.time(), 'prompt': prompt})
+
+    def diagnostics_report(self):
+        """Plain-text snapshot of widget counts, memory, caches and timings"""
+        self.result_windows = [w for w in self.result_windows if w.winfo_exists()]
+
+        def count_widgets(widget):
+            return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+        lines = [
+            f"Tk widgets:             {count_widgets(self.root)}",
+            f"Open result windows:    {len(self.result_windows)}",
+            f"Prompts in history:     {len(self.prompt_history)}",
+            f"Async tasks running:    {self.async_task_count()}",
+            "",
+            "Cache hit rates",
+        ]
+        caches = [('compiled templates', template_cache_info()), ('search word grams', word_grams.cache_info())]
+        for name, info in caches:
+            lookups = info.hits + info.misses
+            rate = f"{info.hits / lookups:.0%}" if lookups else "-"
+            lines.append(f"  {name:<22}{rate:>6}  ({info.hits} hits, {info.misses} misses, {info.currsize} cached)")
+        lines.append(f"  {'option file indexes':<22}{len(_option_file_indexes):>6}  loaded")
+
+        lines += ["", f"Last {len(self.timings)} timings (ms)"]
+        for label, ms in reversed(self.timings):
+            lines.append(f"  {ms:>9.1f}  {label}")
+
+        lines += ["", "Top allocations since the panel opened"]
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            lines.append(f"  traced {current / 1024:,.0f} KB (peak {peak / 1024:,.0f} KB)")
+            stats = tracemalloc.take_snapshot().statistics('lineno')
+            for stat in stats[:DIAGNOSTICS_TOP_ALLOCATIONS]:
+                frame = stat.traceback[0]
+                lines.append(f"  {stat.size / 1024:>9,.1f} KB  {os.path.basename(frame.filename)}:{frame.lineno}")
+        return '\n'.join(lines)
+
+    def async_task_count(self):
+        """Async task count for the diagnostics panel"""
+        if self.bridge is None:
+            return '-'
+        count = self.bridge.pending_tasks()
+        return 'loop busy' if count is None else count
+
+    def show_diagnostics(self, event=None):
+        """Open (or raise) the diagnostics panel"""
+        if self.diagnostics_window is not None and self.diagnostics_window.winfo_exists():
+            self.diagnostics_window.lift()
+            return
+
+        # Allocation tracing costs time, so it only runs while the panel is open
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+
+        window = tk.Toplevel(self.root)
+        window.title("Diagnostics - Comet Browser Mastery")
+        window.geometry("640x560")
+        window.configure(bg=self.colors['bg_light'])
+        self.diagnostics_window = window
 
-        prompt = re.sub(r'{{#if\s+(\w+)}}([\s\S]*?){{/if}}', replace_conditional, prompt)
+        text_widget = scrolledtext.ScrolledText(
+            window,
+            font=self.fonts['mono'],
+            wrap='none',
+            relief='flat',
+            padx=15,
+            pady=15
+        )
+        text_widget.pack(fill='both', expand=True, padx=10, pady=10)
 
-        # Show result
-        self.show_prompt_result(prompt.strip())
+        def refresh():
+            if not window.winfo_exists():
+                return
+            text_widget.configure(state='normal')
+            text_widget.delete('1.0', 'end')
+            text_widget.insert('1.0', self.diagnostics_report())
+            text_widget.configure(state='disabled')
+            window.refresh_job = window.after(DIAGNOSTICS_REFRESH_MS, refresh)
+
+        def on_close():
+            window.after_cancel(window.refresh_job)
+            if started_tracing:
+                tracemalloc.stop()
+            self.diagnostics_window = None
+            window.destroy()
+
+        window.protocol('WM_DELETE_WINDOW', on_close)
+        refresh()
 
     def show_prompt_result(self, prompt):
         """Show the generated prompt in a new window"""
         result_window = tk.Toplevel(self.root)
+        self.result_windows.append(result_window)
         result_window.title("YOUR CUSTOMIZED PROMPT - Edmund Bogen Team")
         result_window.geometry("800x600")
         result_window.configure(bg=self.colors['bg_light'])
@@ -964,7 +3422,7 @@ class CometBrowserMasteryApp:
         title_label = tk.Label(
             header_frame,
             text="YOUR CUSTOMIZED PROMPT",  # ALL CAPS
-            font=('Helvetica', 18, 'bold'),
+            font=self.fonts['heading'],
             bg=self.colors['bg_white'],
             fg=self.colors['primary']  # Navy
         )
@@ -974,8 +3432,8 @@ class CometBrowserMasteryApp:
         copy_button = tk.Label(
             header_frame,
             text="COPY TO CLIPBOARD",  # ALL CAPS for CTA
-            font=('Helvetica', 11, 'bold'),
-            bg='#00a8e1',  # Bright blue
+            font=self.fonts['body_bold'],
+            bg=self.colors['secondary'],  # Bright blue
             fg='white',
             cursor='hand2',
             padx=20,
@@ -983,15 +3441,29 @@ class CometBrowserMasteryApp:
         )
         copy_button.pack(side='right')
 
+        # Save every prompt from this session to one file
+        bundle_button = tk.Label(
+            header_frame,
+            text="SAVE BUNDLE",
+            font=self.fonts['body_bold'],
+            bg=self.colors['primary'],
+            fg='white',
+            cursor='hand2',
+            padx=20,
+            pady=10
+        )
+        bundle_button.pack(side='right', padx=(0, 10))
+        bundle_button.bind('<Button-1>', lambda e: self.save_bundle(result_window))
+
         # Make label clickable
         copy_button.bind('<Button-1>', lambda e: self.copy_to_clipboard(prompt, result_window))
 
         # Hover effect
         def on_hover(e):
-            copy_button.configure(bg='#0090c5')
+            copy_button.configure(bg=self.colors['accent_hover'])
 
         def on_leave(e):
-            copy_button.configure(bg='#00a8e1')
+            copy_button.configure(bg=self.colors['secondary'])
 
         copy_button.bind('<Enter>', on_hover)
         copy_button.bind('<Leave>', on_leave)
@@ -1002,7 +3474,7 @@ class CometBrowserMasteryApp:
 
         text_widget = scrolledtext.ScrolledText(
             text_frame,
-            font=('Courier', 11),
+            font=self.fonts['mono'],
             wrap='word',
             relief='flat',
             padx=20,
@@ -1013,15 +3485,15 @@ class CometBrowserMasteryApp:
         text_widget.configure(state='disabled')
 
         # Tip - Brand styling
-        tip_frame = tk.Frame(result_window, bg='#e8f4f8', relief='flat', borderwidth=0)
+        tip_frame = tk.Frame(result_window, bg=self.colors['tip_bg'], relief='flat', borderwidth=0)
         tip_frame.pack(fill='x', padx=20, pady=(0, 20))
 
         tip_label = tk.Label(
             tip_frame,
             text=("NEXT STEPS: Copy this prompt and paste it into your agentic browser\n"
                   "(Comet, ChatGPT, Claude) to get instant, customized assistance for your situation."),
-            font=('Helvetica', 11),
-            bg='#e8f4f8',
+            font=self.fonts['body'],
+            bg=self.colors['tip_bg'],
             fg=self.colors['primary'],  # Navy
             justify='left',
             padx=20,
@@ -1029,18 +3501,185 @@ class CometBrowserMasteryApp:
         )
         tip_label.pack()
 
+    def show_toast(self, window, message, duration=TOAST_MS):
+        """Show a message at the bottom of a window without blocking it
+
+        A window shows one toast at a time; a new message replaces the old
+        one. With duration None the toast stays until it is replaced.
+        """
+        if not window.winfo_exists():
+            window = self.root
+
+        toast = getattr(window, 'toast', None)
+        if toast is None or not toast.winfo_exists():
+            toast = tk.Label(
+                window,
+                font=self.fonts['body_bold'],
+                bg=self.colors['primary'],
+                fg='white',
+                padx=20,
+                pady=10
+            )
+            toast.place(relx=0.5, rely=1.0, y=-20, anchor='s')
+            toast.hide_job = None
+            window.toast = toast
+        elif toast.hide_job is not None:
+            toast.after_cancel(toast.hide_job)
+
+        toast.configure(text=message)
+        toast.lift()
+        toast.hide_job = toast.after(duration, toast.destroy) if duration is not None else None
+
     def copy_to_clipboard(self, text, window):
-        """Copy text to clipboard"""
+        """Copy text to clipboard
+
+        Text is appended CLIPBOARD_CHUNK_SIZE characters at a time, one
+        chunk per event loop turn, so the window stays responsive while a
+        multi-megabyte bundle is copied. Starting another copy abandons
+        the one in progress.
+        """
+        self.clipboard_job += 1
+        job = self.clipboard_job
+        start = time.perf_counter()
         self.root.clipboard_clear()
-        self.root.clipboard_append(text)
-        messagebox.showinfo("Copied!", "Prompt copied to clipboard!")
+
+        def append(pos):
+            if job != self.clipboard_job:
+                return
+            end = pos + CLIPBOARD_CHUNK_SIZE
+            self.root.clipboard_append(text[pos:end])
+            if end < len(text):
+                self.show_toast(window, f"COPYING... {end * 100 // len(text)}%", duration=None)
+                self.root.after(1, append, end)
+            else:
+                self.timings.append(('copy to clipboard', (time.perf_counter() - start) * 1000))
+                self.show_toast(window, "Prompt copied to clipboard!")
+
+        append(0)
+
+    def save_bundle(self, window):
+        """Save the session's prompts to a Markdown or HTML file
+
+        The file is written on a background thread; progress comes back
+        through a queue that the Tk loop polls.
+        """
+        entries = list(self.prompt_history)
+        if not entries:
+            self.show_toast(window, "No prompts to save yet")
+            return
+
+        path = filedialog.asksaveasfilename(
+            parent=window,
+            title="Save Prompt Bundle",
+            initialfile="prompt-bundle.md",
+            defaultextension=".md",
+            filetypes=[("Markdown", "*.md"), ("HTML", "*.html")]
+        )
+        if not path:
+            return
+
+        updates = queue.Queue()
+        start = time.perf_counter()
+
+        def write():
+            try:
+                with open(path, 'w', encoding='utf-8') as output:
+                    write_bundle(entries, output, bundle_format(path),
+                                 progress=lambda done, total: updates.put(('progress', done, total)))
+            except Exception as exc:  # Report anything, or poll() would wait forever
+                updates.put(('error', str(exc), None))
+            else:
+                updates.put(('done', len(entries), None))
+
+        def poll():
+            latest = None
+            while True:
+                try:
+                    latest = updates.get_nowait()
+                except queue.Empty:
+                    break
+
+            if latest is None:
+                pass
+            elif latest[0] == 'progress':
+                self.show_toast(window, f"SAVING BUNDLE... {latest[1]} of {latest[2]}", duration=None)
+            elif latest[0] == 'done':
+                self.timings.append(('save bundle', (time.perf_counter() - start) * 1000))
+                self.show_toast(window, f"Saved {latest[1]} prompts to {os.path.basename(path)}")
+                return
+            else:
+                if window.winfo_exists() and getattr(window, 'toast', None) is not None:
+                    window.toast.destroy()
+                messagebox.showerror("Could Not Save Bundle", latest[1])
+                return
+            self.root.after(BUNDLE_POLL_MS, poll)
+
+        self.show_toast(window, "SAVING BUNDLE...", duration=None)
+        threading.Thread(target=write, daemon=True).start()
+        self.root.after(BUNDLE_POLL_MS, poll)
 
 
 def main():
     """Main entry point"""
+    parser = argparse.ArgumentParser(description="Comet Browser Mastery - AI Prompt Generator")
+    parser.add_argument('--card-renderer', choices=['canvas', 'widgets'], default='canvas',
+                        help="how use case cards are drawn on the main menu")
+    parser.add_argument('--theme', choices=sorted(THEMES), default='brand',
+                        help="color theme")
+    parser.add_argument('--ui-scale', type=float, default=1.0,
+                        help="font scale, also adjustable with Ctrl +/-/0")
+    parser.add_argument('--batch', metavar='CSV',
+                        help="render --use-case for every row of a CSV file and print JSON lines")
+    parser.add_argument('--use-case', metavar='ID', help="use case id for batch mode")
+    parser.add_argument('--chunk-size', type=int, default=BATCH_CHUNK_SIZE,
+                        help="rows normalized and rendered per chunk in batch mode")
+    parser.add_argument('--pipeline', metavar='JSON',
+                        help="run a pipeline definition and print JSON lines (per CSV row with --batch)")
+    parser.add_argument('--input', metavar='NAME=VALUE', action='append', default=[],
+                        help="pipeline input, may be repeated")
+    parser.add_argument('--serve', action='store_true',
+                        help="run the render daemon for render_client.py instead of the GUI")
+    parser.add_argument('--socket', metavar='PATH',
+                        help="Unix socket path for --serve (default: per-user temp file)")
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.socket)
+        return
+
+    if args.pipeline:
+        discover_packs()
+        try:
+            pipeline = load_pipeline(args.pipeline)
+        except (OSError, ValueError) as exc:  # Includes PipelineError and bad JSON
+            parser.error(f"{args.pipeline}: {exc}")
+        if args.batch:
+            with open(args.batch, newline='', encoding='utf-8') as f:
+                run_pipeline_batch(pipeline, csv.DictReader(f), sys.stdout)
+        else:
+            inputs = dict(item.partition('=')[::2] for item in args.input)
+            run_pipeline_batch(pipeline, [inputs], sys.stdout)
+        return
+
+    if args.batch:
+        if not args.use_case:
+            parser.error("--batch needs --use-case")
+        discover_packs()
+        try:
+            find_use_case(args.use_case)
+        except KeyError as exc:
+            parser.error(exc.args[0])
+        try:
+            run_batch(args.use_case, args.batch, sys.stdout, args.chunk_size)
+        except (OSError, ValueError) as exc:  # Missing or unreadable CSV
+            parser.error(f"{args.batch}: {exc}")
+        return
+
     root = tk.Tk()
-    app = CometBrowserMasteryApp(root)
-    root.mainloop()
+    bridge = AsyncBridge(root)
+    app = CometBrowserMasteryApp(root, card_renderer=args.card_renderer,
+                                 theme=args.theme, ui_scale=args.ui_scale, bridge=bridge)
+    bridge.run()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Comet Browser Mastery - Render Client
+Thin command-line client for the warm render daemon
+
+Renders one prompt without paying for the GUI module's import and template
+compilation when a daemon started with
+    python3 comet_browser_mastery_gui.py --serve
+is running. Falls back to rendering in-process when it isn't.
+
+Usage:
+    python3 render_client.py expired-fsbo address="123 Main St" listingType="Expired Listing"
+"""
+
+import json
+import os
+import socket
+import stat
+import sys
+import tempfile
+
+DAEMON_TIMEOUT = 10.0  # Seconds to wait on the daemon before rendering in-process
+
+
+def socket_dir(create=False):
+    """Per-user directory for the daemon socket, or None if it isn't safe
+
+    $XDG_RUNTIME_DIR when the session has one, otherwise a 0700 directory of
+    our own under the temp dir. A directory that another user owns, or that
+    others can write to, is never used.
+    """
+    if not hasattr(os, 'getuid'):
+        return None
+    uid = os.getuid()
+    path = os.environ.get('XDG_RUNTIME_DIR')
+    if not path:
+        path = os.path.join(tempfile.gettempdir(), f'comet-browser-mastery-{uid}')
+        if create:
+            try:
+                os.mkdir(path, 0o700)
+            except FileExistsError:
+                pass
+    try:
+        info = os.lstat(path)
+    except OSError:
+        return None
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != uid or info.st_mode & 0o077:
+        return None
+    return path
+
+
+def default_socket_path(create=False):
+    """Per-user socket path shared by the daemon and the client, or None"""
+    path = os.environ.get('COMET_RENDER_SOCKET')
+    if path:
+        return path
+    directory = socket_dir(create)
+    return os.path.join(directory, 'comet-browser-mastery.sock') if directory else None
+
+
+def socket_is_trusted(path):
+    """Whether path is a socket owned by this user that no one else can swap out"""
+    if not hasattr(os, 'getuid'):
+        return False
+    try:
+        info = os.lstat(path)
+        parent = os.stat(os.path.dirname(os.path.abspath(path)))
+    except OSError:
+        return False
+    uid = os.getuid()
+    if not stat.S_ISSOCK(info.st_mode) or info.st_uid != uid:
+        return False
+    # Others may only write to the directory if it is sticky (like /tmp)
+    return parent.st_uid == uid and not parent.st_mode & 0o022 or bool(parent.st_mode & stat.S_ISVTX)
+
+
+def render_via_daemon(request, path=None):
+    """Send a render request to the daemon
+
+    Returns None, so the caller renders in-process, if no daemon of ours is
+    listening or it doesn't answer within DAEMON_TIMEOUT.
+    """
+    if not hasattr(socket, 'AF_UNIX'):
+        return None
+    path = path or default_socket_path()
+    if path is None or not socket_is_trusted(path):
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(DAEMON_TIMEOUT)
+            sock.connect(path)
+            sock.sendall(json.dumps(request).encode('utf-8') + b'\n')
+            with sock.makefile('rb') as reply:
+                line = reply.readline()
+        return json.loads(line) if line else None
+    except (OSError, ValueError):  # Includes timeouts and garbled replies
+        return None
+
+
+def render_in_process(request):
+    """Render without the daemon by importing the app module"""
+    import comet_browser_mastery_gui as gui
+    gui.discover_packs()
+    return gui.handle_render_request(request)
+
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] in ('-h', '--help'):
+        print(__doc__.strip())
+        return 0 if len(sys.argv) >= 2 else 2
+
+    fields = {}
+    for arg in sys.argv[2:]:
+        key, sep, value = arg.partition('=')
+        if not sep:
+            print(f"Expected field=value, got: {arg}", file=sys.stderr)
+            return 2
+        fields[key] = value
+    request = {'use_case': sys.argv[1], 'fields': fields}
+
+    result = render_via_daemon(request)
+    if result is None:
+        result = render_in_process(request)
+
+    if 'error' in result:
+        print(result['error'], file=sys.stderr)
+        return 1
+    print(result['prompt'])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())